@@ -20,8 +20,13 @@ st.set_page_config(
 )
 
 # Import custom modules
-from technical_indicators import calculate_technical_indicators
-from news_scraper import get_stock_news
+from config import CHART_CONFIG, INDICATOR_CACHE, INTRADAY_CONFIG
+from charts import create_macd_chart, create_rsi_chart, create_stock_chart
+from indicator_cache import cached_technical_indicators
+from data_store import get_stock_history, is_intraday
+from info_cache import get_company_info
+from news_ingest import get_symbol_news, is_ingestion_pending, start_news_ingestion
+from thumbnail_cache import get_cached_thumbnails
 from chatbot import render_chatbot
 
 # Custom CSS
@@ -93,6 +98,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def main():
+    start_news_ingestion()
     st.markdown('<h1 class="main-header">📈 Stock Market Dashboard</h1>', unsafe_allow_html=True)
     
     # Sidebar for stock selection
@@ -135,6 +141,13 @@ def main():
                 value=datetime.now()
             )
         
+        interval = st.selectbox(
+            "Interval:",
+            INTRADAY_CONFIG["INTERVALS"],
+            help="Intraday bars are only available for recent dates (1m: 30 days, "
+                 "5m/15m: 60 days, 1h: 2 years)"
+        )
+        
         # Chart type selection
         chart_type = st.selectbox(
             "Chart Type:",
@@ -153,6 +166,12 @@ def main():
         show_rsi = st.checkbox("RSI")
         show_macd = st.checkbox("MACD")
         show_volume = st.checkbox("Volume", value=True)
+        
+        # Narrow the date range to zoom in; ranges that fit are drawn at full resolution
+        max_points = st.number_input(
+            "Max chart points (0 = full resolution)",
+            min_value=0, value=CHART_CONFIG["MAX_POINTS"], step=500
+        )
 
     # Main content tabs
     tab1, tab2 = st.tabs(["📊 Dashboard", "📰 News"])
@@ -160,7 +179,8 @@ def main():
     with tab1:
         render_dashboard(symbol, start_date, end_date, chart_type, 
                         show_sma, sma_period, show_ema, ema_period,
-                        show_bollinger, show_rsi, show_macd, show_volume)
+                        show_bollinger, show_rsi, show_macd, show_volume, max_points,
+                        interval)
     
     with tab2:
         render_news_tab(symbol)
@@ -170,14 +190,16 @@ def main():
 
 def render_dashboard(symbol, start_date, end_date, chart_type, 
                     show_sma, sma_period, show_ema, ema_period,
-                    show_bollinger, show_rsi, show_macd, show_volume):
+                    show_bollinger, show_rsi, show_macd, show_volume,
+                    max_points=CHART_CONFIG["MAX_POINTS"], interval="1d"):
     
     try:
-        # Fetch stock data
+        # Fetch stock data; intraday ranges include the end date's session
+        if is_intraday(interval):
+            end_date = end_date + timedelta(days=1)
         with st.spinner(f"Loading data for {symbol}..."):
-            stock = yf.Ticker(symbol)
-            data = stock.history(start=start_date, end=end_date)
-            info = stock.info
+            data = get_stock_history(symbol, start_date, end_date, interval)
+            info = get_company_info(symbol)
         
         if data.empty:
             st.error(f"No data found for symbol {symbol}")
@@ -216,22 +238,31 @@ def render_dashboard(symbol, start_date, end_date, chart_type,
                 value=f"${data['Low'].min():.2f}"
             )
         
-        # Calculate technical indicators
-        data_with_indicators = calculate_technical_indicators(
-            data, sma_period, ema_period
+        # Calculate only the technical indicators selected in the sidebar
+        selected_indicators = [
+            name for name, selected in [
+                ("SMA", show_sma), ("EMA", show_ema), ("Bollinger", show_bollinger),
+                ("RSI", show_rsi), ("MACD", show_macd)
+            ] if selected
+        ]
+        compact = INDICATOR_CACHE["COMPACT"]
+        data_with_indicators = cached_technical_indicators(
+            data, sma_period, ema_period, indicators=selected_indicators, compact=compact
         )
+        if compact:
+            data_with_indicators = pd.concat([data, data_with_indicators], axis=1)
         
         # Create main chart
         fig = create_stock_chart(
             data_with_indicators, symbol, chart_type,
-            show_sma, show_ema, show_bollinger, show_volume
+            show_sma, show_ema, show_bollinger, show_volume, max_points
         )
         
         st.plotly_chart(fig, use_container_width=True)
         
         # Technical indicators charts
         if show_rsi or show_macd:
-            render_technical_charts(data_with_indicators, show_rsi, show_macd)
+            render_technical_charts(data_with_indicators, show_rsi, show_macd, max_points)
         
         # Stock information
         if info:
@@ -244,219 +275,15 @@ def render_dashboard(symbol, start_date, end_date, chart_type,
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
 
-def create_stock_chart(data, symbol, chart_type, show_sma, show_ema, show_bollinger, show_volume):
-    # Create subplots
-    rows = 2 if show_volume else 1
-    fig = make_subplots(
-        rows=rows, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.03,
-        subplot_titles=[f'{symbol} Stock Price', 'Volume'] if show_volume else [f'{symbol} Stock Price'],
-        row_width=[0.7, 0.3] if show_volume else [1.0]
-    )
-    
-    # Main price chart
-    if chart_type == "Candlestick":
-        fig.add_trace(
-            go.Candlestick(
-                x=data.index,
-                open=data['Open'],
-                high=data['High'],
-                low=data['Low'],
-                close=data['Close'],
-                name="Price"
-            ),
-            row=1, col=1
-        )
-    elif chart_type == "Line":
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['Close'],
-                mode='lines',
-                name='Close Price',
-                line=dict(color='#1f77b4')
-            ),
-            row=1, col=1
-        )
-    elif chart_type == "Area":
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['Close'],
-                fill='tonexty',
-                mode='lines',
-                name='Close Price',
-                line=dict(color='#1f77b4')
-            ),
-            row=1, col=1
-        )
-    elif chart_type == "OHLC":
-        fig.add_trace(
-            go.Ohlc(
-                x=data.index,
-                open=data['Open'],
-                high=data['High'],
-                low=data['Low'],
-                close=data['Close'],
-                name="OHLC"
-            ),
-            row=1, col=1
-        )
-    
-    # Add technical indicators
-    if show_sma and 'SMA' in data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['SMA'],
-                mode='lines',
-                name='SMA',
-                line=dict(color='orange', width=2)
-            ),
-            row=1, col=1
-        )
-    
-    if show_ema and 'EMA' in data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['EMA'],
-                mode='lines',
-                name='EMA',
-                line=dict(color='red', width=2)
-            ),
-            row=1, col=1
-        )
-    
-    if show_bollinger and all(col in data.columns for col in ['BB_Upper', 'BB_Lower']):
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['BB_Upper'],
-                mode='lines',
-                name='BB Upper',
-                line=dict(color='gray', width=1),
-                showlegend=False
-            ),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['BB_Lower'],
-                mode='lines',
-                name='BB Lower',
-                line=dict(color='gray', width=1),
-                fill='tonexty',
-                fillcolor='rgba(128,128,128,0.1)',
-                showlegend=False
-            ),
-            row=1, col=1
-        )
-    
-    # Volume chart
-    if show_volume:
-        colors = ['red' if close < open else 'green' 
-                 for close, open in zip(data['Close'], data['Open'])]
-        
-        fig.add_trace(
-            go.Bar(
-                x=data.index,
-                y=data['Volume'],
-                name='Volume',
-                marker_color=colors,
-                opacity=0.7
-            ),
-            row=2, col=1
-        )
-    
-    # Update layout
-    fig.update_layout(
-        title=f'{symbol} Stock Analysis',
-        yaxis_title='Price ($)',
-        xaxis_rangeslider_visible=False,
-        height=600 if show_volume else 500,
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01
-        )
-    )
-    
-    if show_volume:
-        fig.update_yaxes(title_text="Volume", row=2, col=1)
-    
-    return fig
-
-def render_technical_charts(data, show_rsi, show_macd):
+def render_technical_charts(data, show_rsi, show_macd, max_points=None):
     if show_rsi and 'RSI' in data.columns:
         st.subheader("📊 RSI (Relative Strength Index)")
-        fig_rsi = go.Figure()
-        fig_rsi.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['RSI'],
-                mode='lines',
-                name='RSI',
-                line=dict(color='purple')
-            )
-        )
-        fig_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
-        fig_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
-        fig_rsi.update_layout(
-            title="RSI Indicator",
-            yaxis_title="RSI",
-            height=300,
-            yaxis=dict(range=[0, 100])
-        )
+        fig_rsi = create_rsi_chart(data, max_points)
         st.plotly_chart(fig_rsi, use_container_width=True)
     
     if show_macd and all(col in data.columns for col in ['MACD', 'MACD_Signal', 'MACD_Histogram']):
         st.subheader("📊 MACD (Moving Average Convergence Divergence)")
-        fig_macd = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.03,
-            subplot_titles=['MACD Line & Signal', 'MACD Histogram']
-        )
-        
-        fig_macd.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['MACD'],
-                mode='lines',
-                name='MACD',
-                line=dict(color='blue')
-            ),
-            row=1, col=1
-        )
-        
-        fig_macd.add_trace(
-            go.Scatter(
-                x=data.index,
-                y=data['MACD_Signal'],
-                mode='lines',
-                name='Signal',
-                line=dict(color='red')
-            ),
-            row=1, col=1
-        )
-        
-        colors = ['red' if val < 0 else 'green' for val in data['MACD_Histogram']]
-        fig_macd.add_trace(
-            go.Bar(
-                x=data.index,
-                y=data['MACD_Histogram'],
-                name='Histogram',
-                marker_color=colors
-            ),
-            row=2, col=1
-        )
-        
-        fig_macd.update_layout(height=400, title="MACD Indicator")
+        fig_macd = create_macd_chart(data, max_points)
         st.plotly_chart(fig_macd, use_container_width=True)
 
 def render_stock_info(info):
@@ -482,10 +309,12 @@ def render_news_tab(symbol):
     st.header(f"📰 Latest News for {symbol}")
     
     try:
-        news_data = get_stock_news(symbol)
+        news_data = get_symbol_news(symbol)[:10]  # Show top 10 articles
         
         if news_data:
-            for article in news_data[:10]:  # Show top 10 articles
+            # Serve thumbnails the ingestion worker already cached; never download here
+            thumbnails = get_cached_thumbnails(article.get('image') for article in news_data)
+            for article in news_data:
                 with st.container():
                     col1, col2 = st.columns([3, 1])
                     
@@ -497,12 +326,16 @@ def render_news_tab(symbol):
                             st.markdown(f"[Read more]({article['link']})")
                     
                     with col2:
-                        if article.get('image'):
-                            st.image(article['image'], width=200)
+                        thumbnail = thumbnails.get(article.get('image'))
+                        if thumbnail:
+                            st.image(thumbnail, width=200)
                     
                     st.divider()
         else:
-            st.info("No news articles found for this symbol.")
+            if is_ingestion_pending(symbol):
+                st.info("Fetching news for this symbol, check back in a moment.")
+            else:
+                st.info("No news articles found for this symbol.")
     
     except Exception as e:
         st.error(f"Error loading news: {str(e)}")
@@ -0,0 +1,95 @@
+"""
+Measure the JSON payload size of the dashboard charts
+
+Usage: python benchmarks/bench_chart_payload.py [--bars 250] [--max-points 2000]
+
+Builds the price (candlestick + SMA/EMA/Bollinger + volume), RSI and MACD
+charts and compares the payload st.plotly_chart sends against the same
+figures encoded the old way: ISO date strings and JSON number lists.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import (  # noqa: E402
+    create_macd_chart, create_rsi_chart, create_stock_chart, figure_payload_bytes
+)
+from technical_indicators import calculate_technical_indicators  # noqa: E402
+
+DATA_ATTRIBUTES = ("x", "y", "open", "high", "low", "close")
+
+
+def _synthetic_ohlcv(bars, seed=42):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    close = np.abs(close) + 1
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.3, bars),
+        "High": close + rng.random(bars),
+        "Low": close - rng.random(bars),
+        "Close": close,
+        "Volume": rng.integers(100_000, 50_000_000, bars),
+        "Dividends": 0.0,
+        "Stock Splits": 0.0
+    }, index=pd.date_range("2000-01-03", periods=bars, freq="B", tz="America/New_York"))
+
+
+def _legacy_figure(fig):
+    """
+    Re-encode a figure's data arrays as ISO date strings and plain lists
+    """
+    traces = []
+    for trace in fig.data:
+        trace = trace.to_plotly_json()
+        for attribute in DATA_ATTRIBUTES:
+            values = trace.get(attribute)
+            if values is None:
+                continue
+            if attribute == "x":
+                values = pd.to_datetime(np.asarray(values), unit="ms").strftime("%Y-%m-%dT%H:%M:%S")
+            trace[attribute] = np.asarray(values).tolist()
+        marker = trace.get("marker", {})
+        if "color" in marker:
+            marker["color"] = np.asarray(marker["color"]).tolist()
+        traces.append(trace)
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=250)
+    parser.add_argument("--max-points", type=int, default=2000)
+    args = parser.parse_args()
+
+    data = _synthetic_ohlcv(args.bars)
+    data = pd.concat([data, calculate_technical_indicators(data, compact=True)], axis=1)
+
+    charts = {
+        "price": create_stock_chart(data, "TEST", "Candlestick", True, True, True, True,
+                                    args.max_points),
+        "rsi": create_rsi_chart(data, args.max_points),
+        "macd": create_macd_chart(data, args.max_points)
+    }
+
+    print(f"{args.bars:,} bars, max {args.max_points:,} points per trace")
+    print(f"{'chart':<8}{'legacy':>12}{'typed':>12}{'reduction':>11}")
+    legacy_total = typed_total = 0
+    for name, fig in charts.items():
+        legacy = figure_payload_bytes(_legacy_figure(fig))
+        typed = figure_payload_bytes(fig)
+        legacy_total += legacy
+        typed_total += typed
+        print(f"{name:<8}{legacy / 1024:>10.1f}KB{typed / 1024:>10.1f}KB{legacy / typed:>10.2f}x")
+    print(f"{'total':<8}{legacy_total / 1024:>10.1f}KB{typed_total / 1024:>10.1f}KB"
+          f"{legacy_total / typed_total:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure memory and accuracy of compact (float32) indicator frames
+
+Usage: python benchmarks/bench_compact.py [--bars 10000]
+
+Compares calculate_technical_indicators(..., compact=True) against the
+default float64 frame (a full OHLCV copy plus indicator columns) and reports
+bytes per 10k bars and the largest relative error of the float32 values.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from technical_indicators import calculate_technical_indicators  # noqa: E402
+
+
+def _synthetic_ohlcv(bars, seed=42):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    close = np.abs(close) + 1
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.3, bars),
+        "High": close + rng.random(bars),
+        "Low": close - rng.random(bars),
+        "Close": close,
+        "Volume": rng.integers(100_000, 50_000_000, bars),
+        "Dividends": 0.0,
+        "Stock Splits": 0.0
+    }, index=pd.date_range("1990-01-01", periods=bars, freq="min", tz="America/New_York"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=10_000)
+    args = parser.parse_args()
+
+    data = _synthetic_ohlcv(args.bars)
+    full = calculate_technical_indicators(data)
+    compact = calculate_technical_indicators(data, compact=True)
+
+    # The compact frame reuses data's index object, so only its columns are new
+    full_bytes = full.memory_usage(index=True, deep=True).sum()
+    compact_bytes = compact.memory_usage(index=False, deep=True).sum()
+    scale = 10_000 / args.bars
+
+    print(f"{args.bars:,} bars, {len(compact.columns)} indicator columns")
+    print(f"float64 frame (copy + indicators): {full_bytes * scale / 1024:>10.1f} KiB per 10k bars")
+    print(f"compact float32 indicators:        {compact_bytes * scale / 1024:>10.1f} KiB per 10k bars")
+    print(f"reduction:                         {full_bytes / compact_bytes:>10.1f}x")
+
+    worst = 0.0
+    for column in compact.columns:
+        reference = full[column].to_numpy()
+        approx = compact[column].to_numpy(dtype=np.float64)
+        finite = np.isfinite(reference) & (reference != 0)
+        error = np.abs(approx[finite] - reference[finite]) / np.abs(reference[finite])
+        if error.size:
+            worst = max(worst, error.max())
+
+    print(f"max relative error: {worst:.2e} (bound 2**-24 = {2.0 ** -24:.2e})")
+    sys.exit(0 if worst <= 2.0 ** -24 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Measure per-message Gemini client setup against the shared client manager
+
+Usage: python benchmarks/bench_gemini_client.py [--messages 50]
+
+Starts a local stand-in for the Gemini REST API that answers
+generateContent instantly, so the timings contain only client-side cost.
+The old chatbot path (configure() and a new GenerativeModel per message) is
+compared with gemini_client.GeminiClientManager, whose construction and
+request times are reported separately.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+warnings.simplefilter("ignore")  # google.generativeai deprecation notice
+
+import google.generativeai as genai  # noqa: E402
+
+from gemini_client import GeminiClientManager  # noqa: E402
+
+MODEL = "gemini-1.5-flash"
+PROMPT = "What is RSI?"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """
+    Minimal generateContent endpoint returning a fixed candidate
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"candidates": [{
+            "content": {"parts": [{"text": "RSI is a momentum oscillator."}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0
+        }]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stand_in_server():
+    """
+    Start the stand-in server on a free port and return its base URL
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def per_message(endpoint, messages):
+    start = time.perf_counter()
+    for _ in range(messages):
+        genai.configure(api_key="stand-in", transport="rest",
+                        client_options={"api_endpoint": endpoint})
+        model = genai.GenerativeModel(model_name=MODEL)
+        model.generate_content(PROMPT).text
+    return time.perf_counter() - start
+
+
+def shared(endpoint, messages):
+    client = GeminiClientManager("stand-in", api_endpoint=endpoint, transport="rest")
+    start = time.perf_counter()
+    for _ in range(messages):
+        client.generate(PROMPT, MODEL)
+    return time.perf_counter() - start, client.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=50)
+    args = parser.parse_args()
+
+    endpoint = start_stand_in_server()
+    per_message(endpoint, 1)  # warm up imports and the server
+
+    old = per_message(endpoint, args.messages)
+    new, stats = shared(endpoint, args.messages)
+
+    print(f"{args.messages} messages against {endpoint}")
+    print(f"configure + GenerativeModel per message: {old / args.messages * 1000:8.2f} ms/message")
+    print(f"shared client manager:                   {new / args.messages * 1000:8.2f} ms/message")
+    print(f"speedup:                                 {old / new:8.2f}x")
+    print(f"manager construction: {stats['construction_seconds'] * 1000:.2f} ms for {stats['models']} model(s), "
+          f"requests: {stats['mean_request_seconds'] * 1000:.2f} ms mean over {stats['requests']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark suite for technical_indicators with regression thresholds
+
+Usage:
+    python benchmarks/bench_indicators.py                    # compare to baselines
+    python benchmarks/bench_indicators.py --update-baseline  # record new baselines
+    python benchmarks/bench_indicators.py --sizes 1000 100000 --only calculate_cci
+
+Each indicator runs on deterministic synthetic OHLCV series (no network
+access) of every requested size. Wall time (best of several runs) and peak
+traced memory are recorded per indicator and size. In compare mode the run
+fails with status 1 if any result exceeds its baseline by more than the
+time or memory threshold.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import technical_indicators as ti  # noqa: E402
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baselines.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# Allowed slowdown/growth over baseline before a result counts as a regression
+TIME_THRESHOLD = 0.5
+MEMORY_THRESHOLD = 0.2
+# Timings below this many seconds are dominated by noise and never fail
+MIN_TIME_SLACK = 0.005
+
+INDICATORS = {
+    "calculate_technical_indicators": lambda df: ti.calculate_technical_indicators(df),
+    "calculate_rsi": lambda df: ti.calculate_rsi(df["Close"]),
+    "calculate_macd": lambda df: ti.calculate_macd(df["Close"]),
+    "calculate_stochastic": lambda df: ti.calculate_stochastic(df),
+    "calculate_atr": lambda df: ti.calculate_atr(df),
+    "calculate_williams_r": lambda df: ti.calculate_williams_r(df),
+    "calculate_cci": lambda df: ti.calculate_cci(df),
+    "calculate_momentum": lambda df: ti.calculate_momentum(df["Close"]),
+    "calculate_roc": lambda df: ti.calculate_roc(df["Close"]),
+}
+
+
+def synthetic_ohlcv(bars, seed=42):
+    """
+    Deterministic random-walk OHLCV frame with a one-minute DatetimeIndex
+    """
+    rng = np.random.default_rng(seed)
+    close = np.abs(100 + np.cumsum(rng.normal(0, 1, bars))) + 1
+    return pd.DataFrame({
+        "Open": close + rng.normal(0, 0.3, bars),
+        "High": close + rng.random(bars),
+        "Low": close - rng.random(bars),
+        "Close": close,
+        "Volume": rng.integers(100_000, 50_000_000, bars)
+    }, index=pd.date_range("1970-01-01", periods=bars, freq="min"))
+
+
+def measure(func, data, repeat):
+    """
+    Return (best wall time in seconds, peak traced bytes) for func(data)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def run(sizes, names):
+    results = {}
+    for size in sizes:
+        data = synthetic_ohlcv(size)
+        repeat = 5 if size <= 100_000 else 1
+        for name in names:
+            seconds, peak = measure(INDICATORS[name], data, repeat)
+            results[f"{name}@{size}"] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{name:<34}{size:>12,}{seconds:>12.4f}s{peak / 2**20:>12.1f} MiB", flush=True)
+        del data
+    return results
+
+
+def compare(results, baselines, time_threshold, memory_threshold):
+    """
+    Return a list of regression messages for results exceeding their baselines
+    """
+    regressions = []
+    for key, result in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            continue
+
+        time_limit = max(baseline["seconds"] * (1 + time_threshold),
+                         baseline["seconds"] + MIN_TIME_SLACK)
+        if result["seconds"] > time_limit:
+            regressions.append(
+                f"{key}: {result['seconds']:.4f}s vs baseline {baseline['seconds']:.4f}s"
+            )
+
+        memory_limit = baseline["peak_bytes"] * (1 + memory_threshold)
+        if result["peak_bytes"] > memory_limit:
+            regressions.append(
+                f"{key}: {result['peak_bytes'] / 2**20:.1f} MiB vs baseline "
+                f"{baseline['peak_bytes'] / 2**20:.1f} MiB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=sorted(INDICATORS), default=list(INDICATORS))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-threshold", type=float, default=TIME_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    args = parser.parse_args()
+
+    print(f"{'indicator':<34}{'bars':>12}{'time':>13}{'peak memory':>16}")
+    results = run(args.sizes, args.only)
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+
+    if args.update_baseline:
+        baselines.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(dict(sorted(baselines.items())), f, indent=2)
+            f.write("\n")
+        print(f"Wrote {len(results)} baselines to {args.baseline}")
+        return
+
+    regressions = compare(results, baselines, args.time_threshold, args.memory_threshold)
+    if regressions:
+        print("\nRegressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+
+    print("\nNo regressions against baselines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark the kernels.* sliding-window primitives against pandas
+
+Usage: python benchmarks/bench_kernels.py [--bars 1000000] [--window 20]
+
+The pandas rolling(...).apply path that calculate_cci used before the
+kernels module is timed as the reference for mean absolute deviation and CCI.
+Exits with status 1 if either is less than MIN_SPEEDUP times faster.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kernels  # noqa: E402
+from technical_indicators import calculate_cci  # noqa: E402
+
+MIN_SPEEDUP = 10
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _synthetic_ohlc(bars, seed=42):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    return pd.DataFrame({
+        "High": close + rng.random(bars),
+        "Low": close - rng.random(bars),
+        "Close": close
+    })
+
+
+def _reference_cci(data, period):
+    typical_price = (data["High"] + data["Low"] + data["Close"]) / 3
+    sma_tp = typical_price.rolling(window=period).mean()
+    mean_deviation = typical_price.rolling(window=period).apply(
+        lambda x: np.abs(x - x.mean()).mean()
+    )
+    return (typical_price - sma_tp) / (0.015 * mean_deviation)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    parser.add_argument("--window", type=int, default=20)
+    args = parser.parse_args()
+
+    data = _synthetic_ohlc(args.bars)
+    close = data["Close"]
+    values = close.to_numpy()
+    rolling = close.rolling(window=args.window)
+    w = args.window
+
+    cases = [
+        ("mean_abs_deviation",
+         lambda: rolling.apply(lambda x: np.abs(x - x.mean()).mean()),
+         lambda: kernels.rolling_mean_abs_deviation(values, w), True),
+        ("cci",
+         lambda: _reference_cci(data, w),
+         lambda: calculate_cci(data, w), True),
+        ("std", lambda: rolling.std(), lambda: kernels.rolling_std(values, w), False),
+        ("min", lambda: rolling.min(), lambda: kernels.rolling_min(values, w), False),
+        ("max", lambda: rolling.max(), lambda: kernels.rolling_max(values, w), False),
+    ]
+
+    print(f"{args.bars:,} bars, window {w}")
+    print(f"{'kernel':<20}{'pandas (s)':>12}{'kernels (s)':>13}{'speedup':>10}")
+
+    failed = False
+    for name, reference, kernel, required in cases:
+        ref_time = _timed(reference)
+        kernel_time = _timed(kernel)
+        speedup = ref_time / kernel_time
+        marker = ""
+        if required and speedup < MIN_SPEEDUP:
+            marker = f"  < {MIN_SPEEDUP}x"
+            failed = True
+        print(f"{name:<20}{ref_time:>12.3f}{kernel_time:>13.4f}{speedup:>9.1f}x{marker}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
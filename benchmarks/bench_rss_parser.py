@@ -0,0 +1,114 @@
+"""
+Benchmark the streaming RSS parser against feedparser on feed fixtures
+
+Usage: python benchmarks/bench_rss_parser.py [--items 5] [--repeat 200]
+
+The fixtures in benchmarks/fixtures are synthetic feeds in the Yahoo Finance
+headline RSS 2.0 layout, not recorded data. Each is parsed with
+feedparser.parse (keeping the first --items entries, as the news scraper
+did) and with rss_parser.parse_feed(content, --items). Reports the mean parse
+time and the peak traced allocation of one parse, then compares the articles
+both produce field by field. feedparser re-escapes some ampersands in
+descriptions ('S&amp;P') while parse_feed returns the XML-decoded text
+('S&P'); such fields are reported as entity-escaping differences, and the
+exit status is non-zero only for any other difference.
+"""
+
+import argparse
+import glob
+import html
+import os
+import sys
+import time
+import tracemalloc
+
+import feedparser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from news_scraper import clean_text, extract_image_from_content, format_rss_date  # noqa: E402
+from rss_parser import parse_feed  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "*.xml")
+
+
+def _timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def _peak_bytes(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _article(entry):
+    return {
+        "title": entry.get("title", ""),
+        "summary": clean_text(entry.get("summary", "")),
+        "link": entry.get("link", ""),
+        "published": format_rss_date(entry.get("published", "")),
+        "image": extract_image_from_content(entry.get("content", []))
+    }
+
+
+def _differences(name, baseline_entries, streaming_entries):
+    """
+    Yield (kind, description) for every field where the parsers disagree
+    """
+    if len(baseline_entries) != len(streaming_entries):
+        yield "content", f"{name}: {len(baseline_entries)} vs {len(streaming_entries)} items"
+    for i, (base, fast) in enumerate(zip(baseline_entries, streaming_entries)):
+        base, fast = _article(base), _article(fast)
+        for field in base:
+            if base[field] == fast[field]:
+                continue
+            same_text = html.unescape(base[field] or "") == html.unescape(fast[field] or "")
+            yield ("entity escaping" if same_text else "content",
+                   f"{name} item {i} {field}: feedparser {base[field]!r} vs streaming {fast[field]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'fixture':<34}{'feedparser':>12}{'streaming':>12}{'speedup':>9}"
+          f"{'fp peak':>11}{'st peak':>11}")
+    differences = []
+    for path in sorted(glob.glob(FIXTURES)):
+        with open(path, "rb") as f:
+            content = f.read()
+
+        def baseline():
+            return feedparser.parse(content).entries[:args.items]
+
+        def streaming():
+            return parse_feed(content, args.items)
+
+        differences += _differences(os.path.basename(path), baseline(), streaming())
+
+        base_time = _timed(baseline, args.repeat)
+        fast_time = _timed(streaming, args.repeat)
+        base_peak = _peak_bytes(baseline)
+        fast_peak = _peak_bytes(streaming)
+        print(f"{os.path.basename(path):<34}{base_time * 1000:>10.2f}ms{fast_time * 1000:>10.2f}ms"
+              f"{base_time / fast_time:>8.1f}x{base_peak / 1024:>9.0f}KB{fast_peak / 1024:>9.0f}KB")
+
+    for kind, description in differences:
+        print(f"[{kind}] {description}")
+    escaping = sum(kind == "entity escaping" for kind, _ in differences)
+    content = len(differences) - escaping
+    print(f"{escaping} field(s) differ only in entity escaping, {content} field(s) differ in content")
+    sys.exit(1 if content else 0)
+
+
+if __name__ == "__main__":
+    main()
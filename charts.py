@@ -0,0 +1,263 @@
+"""
+Plotly figure builders for the Stock Dashboard application
+
+Building a figure with make_subplots/add_trace/update_layout costs tens of
+milliseconds per rerun, most of it in Plotly's property validation. The
+layout and trace styling only depend on the chart options, so they are built
+once per combination and cached as plain dicts ("templates"); each rerun only
+copies the template and fills in the data arrays.
+
+Data arrays are passed as NumPy arrays, which Plotly serializes as base64
+typed arrays instead of JSON number lists, and timestamps are sent as epoch
+milliseconds on date axes instead of ISO strings.
+"""
+
+import copy
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from config import CHART_CONFIG
+from downsampling import aggregate_ohlc, lttb_series
+
+# Two-colour scale for bar markers: 0 -> up (green), 1 -> down (red)
+UP_DOWN_COLORSCALE = [[0, 'green'], [1, 'red']]
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def _template(key, build):
+    """
+    Return a copy of the cached (layout, trace specs) template for key
+
+    The layout holds the full Plotly theme, so only its top level and the
+    annotations (whose text is filled per call) are copied.
+    """
+    with _templates_lock:
+        if key not in _templates:
+            _templates[key] = build()
+        layout, traces = _templates[key]
+
+    layout = dict(layout)
+    if 'annotations' in layout:
+        layout['annotations'] = [dict(annotation) for annotation in layout['annotations']]
+    return layout, copy.deepcopy(traces)
+
+
+def scatter_trace_type(n_points):
+    """
+    Pick the Plotly scatter type for a line trace: SVG 'scatter' for small
+    series, WebGL 'scattergl' once it passes CHART_CONFIG["WEBGL_THRESHOLD"]
+    """
+    return 'scattergl' if n_points > CHART_CONFIG["WEBGL_THRESHOLD"] else 'scatter'
+
+
+def up_down_colors(values, reference=0):
+    """
+    Vectorized bar colour codes: 1 where values < reference, else 0
+    """
+    return np.where(np.asarray(values) < np.asarray(reference), 1, 0).astype(np.uint8)
+
+
+def epoch_milliseconds(index):
+    """
+    Timestamps as float64 milliseconds since the epoch, for Plotly date axes
+
+    Plotly ignores UTC offsets in date strings and shows wall-clock time, so
+    tz-aware timestamps are converted to their local wall-clock time first.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        return np.asarray(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[ms]').astype(np.int64).astype(np.float64)
+
+
+def figure_payload_bytes(fig):
+    """
+    Size in bytes of the JSON spec st.plotly_chart sends for a figure
+    """
+    return len(pio.to_json(fig, validate=False).encode())
+
+
+def _line(series, spec):
+    spec['type'] = scatter_trace_type(len(series))
+    spec['x'] = epoch_milliseconds(series.index)
+    spec['y'] = series.to_numpy()
+    return spec
+
+
+def _build_stock_template(chart_type, show_volume, overlays):
+    rows = 2 if show_volume else 1
+    fig = make_subplots(
+        rows=rows, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        subplot_titles=['Stock Price', 'Volume'] if show_volume else ['Stock Price'],
+        row_width=[0.7, 0.3] if show_volume else [1.0]
+    )
+    fig.update_layout(
+        yaxis_title='Price ($)',
+        xaxis_rangeslider_visible=False,
+        height=600 if show_volume else 500,
+        showlegend=True,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        )
+    )
+    if show_volume:
+        fig.update_yaxes(title_text="Volume", row=2, col=1)
+    fig.update_xaxes(type='date')
+
+    traces = {}
+    if chart_type == "Candlestick":
+        traces['price'] = dict(type='candlestick', name="Price")
+    elif chart_type == "Line":
+        traces['price'] = dict(mode='lines', name='Close Price', line=dict(color='#1f77b4'))
+    elif chart_type == "Area":
+        traces['price'] = dict(fill='tonexty', mode='lines', name='Close Price',
+                               line=dict(color='#1f77b4'))
+    elif chart_type == "OHLC":
+        traces['price'] = dict(type='ohlc', name="OHLC")
+
+    if 'SMA' in overlays:
+        traces['SMA'] = dict(mode='lines', name='SMA', line=dict(color='orange', width=2))
+    if 'EMA' in overlays:
+        traces['EMA'] = dict(mode='lines', name='EMA', line=dict(color='red', width=2))
+    if 'Bollinger' in overlays:
+        traces['BB_Upper'] = dict(mode='lines', name='BB Upper',
+                                  line=dict(color='gray', width=1), showlegend=False)
+        traces['BB_Lower'] = dict(mode='lines', name='BB Lower',
+                                  line=dict(color='gray', width=1), fill='tonexty',
+                                  fillcolor='rgba(128,128,128,0.1)', showlegend=False)
+    if show_volume:
+        traces['Volume'] = dict(
+            type='bar', name='Volume', opacity=0.7, xaxis='x2', yaxis='y2',
+            marker=dict(colorscale=UP_DOWN_COLORSCALE, cmin=0, cmax=1)
+        )
+
+    return fig.layout.to_plotly_json(), traces
+
+
+def create_stock_chart(data, symbol, chart_type, show_sma, show_ema, show_bollinger, show_volume,
+                       max_points=None):
+    """
+    Build the price chart with optional overlays and volume subplot
+    """
+    if max_points is None:
+        max_points = CHART_CONFIG["MAX_POINTS"]
+
+    overlays = tuple(name for name, show, column in [
+        ('SMA', show_sma, 'SMA'), ('EMA', show_ema, 'EMA'), ('Bollinger', show_bollinger, 'BB_Upper')
+    ] if show and column in data.columns)
+    if 'Bollinger' in overlays and 'BB_Lower' not in data.columns:
+        overlays = tuple(name for name in overlays if name != 'Bollinger')
+
+    layout, traces = _template(
+        ('stock', chart_type, show_volume, overlays),
+        lambda: _build_stock_template(chart_type, show_volume, overlays)
+    )
+    layout['title'] = dict(text=f'{symbol} Stock Analysis')
+    layout['annotations'][0]['text'] = f'{symbol} Stock Price'
+
+    # Downsample before filling traces: bucket aggregation for bars, LTTB for lines
+    bars = aggregate_ohlc(data[['Open', 'High', 'Low', 'Close', 'Volume']], max_points)
+
+    price = traces.get('price')
+    if price is not None:
+        if price.get('type') in ('candlestick', 'ohlc'):
+            price.update(x=epoch_milliseconds(bars.index), open=bars['Open'].to_numpy(), high=bars['High'].to_numpy(),
+                         low=bars['Low'].to_numpy(), close=bars['Close'].to_numpy())
+        else:
+            _line(lttb_series(data['Close'], max_points), price)
+
+    for column in ('SMA', 'EMA'):
+        if column in traces:
+            _line(lttb_series(data[column], max_points), traces[column])
+
+    if 'BB_Upper' in traces:
+        # Both bands use the points picked for the upper band so the fill lines up
+        bb_upper = lttb_series(data['BB_Upper'], max_points)
+        _line(bb_upper, traces['BB_Upper'])
+        _line(data['BB_Lower'].loc[bb_upper.index], traces['BB_Lower'])
+
+    if 'Volume' in traces:
+        volume = traces['Volume']
+        volume.update(x=epoch_milliseconds(bars.index), y=bars['Volume'].to_numpy())
+        volume['marker']['color'] = up_down_colors(bars['Close'], bars['Open'])
+
+    return go.Figure(data=list(traces.values()), layout=layout)
+
+
+def _build_rsi_template():
+    fig = go.Figure()
+    fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
+    fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
+    fig.update_layout(
+        title="RSI Indicator",
+        yaxis_title="RSI",
+        height=300,
+        yaxis=dict(range=[0, 100]),
+        xaxis=dict(type='date')
+    )
+    traces = {'RSI': dict(mode='lines', name='RSI', line=dict(color='purple'))}
+    return fig.layout.to_plotly_json(), traces
+
+
+def create_rsi_chart(data, max_points=None):
+    """
+    Build the RSI chart with overbought/oversold guides
+    """
+    if max_points is None:
+        max_points = CHART_CONFIG["MAX_POINTS"]
+
+    layout, traces = _template(('rsi',), _build_rsi_template)
+    _line(lttb_series(data['RSI'], max_points), traces['RSI'])
+
+    return go.Figure(data=list(traces.values()), layout=layout)
+
+
+def _build_macd_template():
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        subplot_titles=['MACD Line & Signal', 'MACD Histogram']
+    )
+    fig.update_layout(height=400, title="MACD Indicator")
+    fig.update_xaxes(type='date')
+    traces = {
+        'MACD': dict(mode='lines', name='MACD', line=dict(color='blue')),
+        'MACD_Signal': dict(mode='lines', name='Signal', line=dict(color='red')),
+        'MACD_Histogram': dict(
+            type='bar', name='Histogram', xaxis='x2', yaxis='y2',
+            marker=dict(colorscale=UP_DOWN_COLORSCALE, cmin=0, cmax=1)
+        )
+    }
+    return fig.layout.to_plotly_json(), traces
+
+
+def create_macd_chart(data, max_points=None):
+    """
+    Build the MACD line/signal chart with a histogram subplot
+    """
+    if max_points is None:
+        max_points = CHART_CONFIG["MAX_POINTS"]
+
+    layout, traces = _template(('macd',), _build_macd_template)
+    _line(lttb_series(data['MACD'], max_points), traces['MACD'])
+    _line(lttb_series(data['MACD_Signal'], max_points), traces['MACD_Signal'])
+
+    histogram = lttb_series(data['MACD_Histogram'], max_points)
+    traces['MACD_Histogram'].update(x=epoch_milliseconds(histogram.index), y=histogram.to_numpy())
+    traces['MACD_Histogram']['marker']['color'] = up_down_colors(histogram)
+
+    return go.Figure(data=list(traces.values()), layout=layout)
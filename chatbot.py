@@ -3,6 +3,8 @@ import google.generativeai as genai
 from datetime import datetime
 import json
 
+from gemini_client import get_gemini_client
+
 def render_chatbot():
     """
     Render the chatbot interface
@@ -424,11 +426,6 @@ def handle_chatbot_message(user_input):
             ai_response = get_fallback_response(user_input)
         else:
             try:
-                from google.generativeai.client import configure
-                from google.generativeai.generative_models import GenerativeModel
-                configure(api_key=GEMINI_API_KEY)
-                model = GenerativeModel(model_name="gemini-1.5-flash")
-                
                 # Create context-aware prompt
                 system_prompt = """
                 You are a helpful stock market and trading assistant. You provide accurate, 
@@ -447,8 +444,8 @@ def handle_chatbot_message(user_input):
                 
                 full_prompt = f"{system_prompt}\n\nUser question: {user_input}"
                 
-                response = model.generate_content(full_prompt)
-                ai_response = response.text
+                # Shared client: configured once per process, model handle reused
+                ai_response = get_gemini_client(GEMINI_API_KEY).generate(full_prompt)
             except Exception as api_error:
                 ai_response = get_fallback_response(user_input)
         
@@ -31,7 +31,42 @@ TECHNICAL_INDICATORS = {
     "BOLLINGER_STD": 2,
     "STOCHASTIC_K": 14,
     "STOCHASTIC_D": 3,
-    "ATR_PERIOD": 14
+    "ATR_PERIOD": 14,
+    "VOLUME_SMA_PERIOD": 20
+}
+
+# Data Store Settings
+DATA_STORE = {
+    "DIRECTORY": ".data/ohlcv",
+    "REFRESH_INTERVAL": 86400,  # 1 day in seconds
+    "MEMORY_CACHE_SIZE": 64  # symbol/interval windows kept in memory
+}
+
+# Intraday Settings (Yahoo Finance limits how far back and how much per request)
+INTRADAY_CONFIG = {
+    "INTERVALS": ["1d", "1h", "15m", "5m", "1m"],
+    "CHUNK_DAYS": {"1m": 7, "5m": 30, "15m": 30, "1h": 180},  # max span per request
+    "LOOKBACK_DAYS": {"1m": 29, "5m": 59, "15m": 59, "1h": 729},  # oldest data available
+    "REFRESH_INTERVAL": 300,  # 5 minutes in seconds
+    "MAX_WORKERS": 4
+}
+
+# Quote Settings
+QUOTES_CONFIG = {
+    "TIMEOUT": 10,  # seconds per symbol request
+    "MAX_WORKERS": 8
+}
+
+# Indicator Cache Settings
+INDICATOR_CACHE = {
+    "MAX_BYTES": 256 * 1024 * 1024,  # shared by all sessions
+    "COMPACT": False  # store indicator columns as float32 without the OHLCV copy
+}
+
+# Company Info Cache Settings
+INFO_CACHE = {
+    "TTL": 86400,  # 1 day in seconds
+    "MAX_SIZE": 256
 }
 
 # Chart Settings
@@ -45,18 +80,56 @@ CHART_COLORS = {
     "VOLUME": "#8c564b"
 }
 
+CHART_CONFIG = {
+    "MAX_POINTS": 2000,  # points per trace after downsampling, 0 = full resolution
+    "WEBGL_THRESHOLD": 2000  # line traces with more points render with WebGL
+}
+
 # News Settings
 NEWS_SOURCES = {
     "YAHOO_FINANCE": "https://feeds.finance.yahoo.com/rss/2.0/headline",
     "MAX_ARTICLES": 15,
-    "CACHE_DURATION": 300  # 5 minutes in seconds
+    "CACHE_DURATION": 300,  # 5 minutes in seconds
+    "TIMEOUT": 5,  # seconds per feed request
+    "DEADLINE": 8,  # seconds for all sources of one news query
+    "MAX_WORKERS": 8,
+    "FEED_CACHE_SIZE": 128  # parsed feeds kept in memory
+}
+
+NEWS_DEDUP = {
+    "DATABASE": ".data/news_dedup.sqlite3",
+    "MAX_DISTANCE": 3  # SimHash bits that may differ between copies of a story
+}
+
+NEWS_STORE = {
+    "DATABASE": ".data/news.sqlite3",
+    "INGEST_INTERVAL": 600,  # seconds between background ingestion runs
+    "RETRY_AFTER": 60,  # first retry delay after an empty scrape, doubled per retry
+    "MAX_WORKERS": 2  # concurrent on-demand scrapes for symbols read but not tracked
+}
+
+THUMBNAIL_CACHE = {
+    "DIRECTORY": ".data/thumbnails",
+    "MAX_BYTES": 50 * 1024 * 1024,  # on-disk budget, least recently used evicted first
+    "WIDTH": 200,
+    "QUALITY": 80,
+    "TIMEOUT": 5,  # seconds per image download
+    "MAX_DOWNLOAD_BYTES": 10 * 1024 * 1024,
+    "MAX_REDIRECTS": 3,
+    "ALLOWED_HOSTS": (),  # hostnames exempt from the public-address check, e.g. ("127.0.0.1",)
+    "RETRY_AFTER": 300,  # seconds before a failed image URL is tried again
+    "MAX_FAILURES": 1024,
+    "MAX_WORKERS": 8
 }
 
 # Chatbot Settings
 CHATBOT_CONFIG = {
     "MAX_MESSAGES": 50,
     "RESPONSE_TIMEOUT": 30,
-    "FALLBACK_RESPONSES": True
+    "FALLBACK_RESPONSES": True,
+    "MODEL": "gemini-1.5-flash",
+    "API_ENDPOINT": None,  # e.g. "http://127.0.0.1:8000" for a local stand-in server
+    "TRANSPORT": None  # "rest" for plain HTTP endpoints, None for the library default
 }
 
 # App Settings
@@ -0,0 +1,329 @@
+"""
+Local on-disk OHLCV store for the Stock Dashboard application
+
+Price history is kept as one Parquet file per symbol and interval, so reruns
+read bars from disk and only the bars newer than the last stored timestamp
+are downloaded from Yahoo Finance. Intraday ranges are split into the chunks
+Yahoo allows per request and downloaded concurrently.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import yfinance as yf
+
+from config import DATA_STORE, INTRADAY_CONFIG
+
+_executor = ThreadPoolExecutor(
+    max_workers=INTRADAY_CONFIG["MAX_WORKERS"], thread_name_prefix="intraday"
+)
+
+
+def _to_timestamp(value, tz):
+    """
+    Convert a date/datetime/string to a Timestamp in the index timezone
+    """
+    ts = pd.Timestamp(value)
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    elif ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts
+
+
+def is_intraday(interval):
+    """
+    Whether an interval is an intraday bar size with Yahoo range limits
+    """
+    return interval in INTRADAY_CONFIG["CHUNK_DAYS"]
+
+
+def _refresh_interval(interval, default):
+    return INTRADAY_CONFIG["REFRESH_INTERVAL"] if is_intraday(interval) else default
+
+
+def _fetch_range(symbol, start, end, interval):
+    return yf.Ticker(symbol).history(start=start, end=end, interval=interval)
+
+
+def _has_new_corporate_actions(bars, stored):
+    """
+    Whether bars carry a split or dividend that stored does not, after which
+    Yahoo re-adjusts every earlier bar
+    """
+    columns = [
+        column for column in ("Dividends", "Stock Splits")
+        if column in bars.columns and column in stored.columns
+    ]
+    if not columns:
+        return False
+
+    def action_dates(data):
+        return data.index[data[columns].fillna(0).ne(0).any(axis=1)]
+
+    return not action_dates(bars).difference(action_dates(stored)).empty
+
+
+def intraday_chunks(start, end, interval):
+    """
+    Split [start, end) into the ranges Yahoo serves for an intraday interval
+
+    The start is clamped to the oldest bar Yahoo keeps for the interval and
+    each range spans at most INTRADAY_CONFIG["CHUNK_DAYS"][interval] days.
+    """
+    tz = pd.Timestamp(start).tz if start is not None else None
+    now = pd.Timestamp.now(tz)
+    end = now if end is None else _to_timestamp(end, tz)
+    earliest = now - pd.Timedelta(days=INTRADAY_CONFIG["LOOKBACK_DAYS"][interval])
+    start = earliest if start is None else max(_to_timestamp(start, tz), earliest)
+
+    chunk = pd.Timedelta(days=INTRADAY_CONFIG["CHUNK_DAYS"][interval])
+    chunks = []
+    while start < end:
+        chunks.append((start, min(start + chunk, end)))
+        start += chunk
+    return chunks
+
+
+def _download_history(symbol, start=None, end=None, interval="1d"):
+    """
+    Download price history for a symbol from Yahoo Finance
+
+    Intraday ranges are fetched as concurrent chunks, then stitched together
+    with bars shared by neighbouring chunks de-duplicated.
+    """
+    if not is_intraday(interval):
+        return _fetch_range(symbol, start, end, interval)
+
+    futures = [
+        _executor.submit(_fetch_range, symbol, chunk_start, chunk_end, interval)
+        for chunk_start, chunk_end in intraday_chunks(start, end, interval)
+    ]
+    parts = [future.result() for future in futures]
+    non_empty = [part for part in parts if not part.empty]
+    if not non_empty:
+        return parts[0] if parts else pd.DataFrame()
+
+    data = pd.concat(non_empty)
+    return data[~data.index.duplicated(keep="last")].sort_index()
+
+
+class OHLCVStore:
+    """
+    Parquet-backed OHLCV store partitioned by interval and symbol
+    """
+
+    def __init__(self, directory=None, refresh_interval=None):
+        self.directory = directory or DATA_STORE["DIRECTORY"]
+        self.refresh_interval = (
+            DATA_STORE["REFRESH_INTERVAL"] if refresh_interval is None else refresh_interval
+        )
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _path(self, symbol, interval):
+        return os.path.join(self.directory, interval, f"{symbol.upper()}.parquet")
+
+    def _meta_path(self, symbol, interval):
+        return os.path.join(self.directory, interval, f"{symbol.upper()}.json")
+
+    def _lock(self, symbol, interval):
+        key = (symbol.upper(), interval)
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def load(self, symbol, interval="1d"):
+        """
+        Load the stored bars and metadata for a symbol, or (None, {}) if absent
+        """
+        path = self._path(symbol, interval)
+        if not os.path.exists(path):
+            return None, {}
+
+        try:
+            data = pd.read_parquet(path)
+            with open(self._meta_path(symbol, interval)) as f:
+                meta = json.load(f)
+            return data, meta
+        except Exception:
+            return None, {}
+
+    def save(self, symbol, data, meta, interval="1d"):
+        """
+        Atomically write bars and metadata for a symbol
+        """
+        path = self._path(symbol, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+        meta_path = self._meta_path(symbol, interval)
+        tmp_meta_path = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_meta_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta_path, meta_path)
+
+    def get_history(self, symbol, start, end=None, interval="1d"):
+        """
+        Return bars in [start, end) for a symbol, downloading only what is missing
+
+        Bars older than the stored range are backfilled once; newer bars are
+        appended at most once per refresh interval, starting from the last
+        stored timestamp so a partially formed last bar gets replaced. If the
+        new bars include a split or dividend, the whole stored range is
+        downloaded again because Yahoo adjusts every earlier price for it.
+        """
+        symbol = symbol.upper()
+
+        with self._lock(symbol, interval):
+            stored, meta = self.load(symbol, interval)
+            changed = False
+
+            if stored is None or stored.empty:
+                stored = _download_history(symbol, start=start, interval=interval)
+                if stored.empty:
+                    return stored
+                meta = {"start": str(pd.Timestamp(start).date()), "refreshed": time.time()}
+                changed = True
+            else:
+                tz = stored.index.tz
+                covered_start = _to_timestamp(meta.get("start", stored.index[0]), tz)
+                requested_start = _to_timestamp(start, tz)
+
+                backfilled = requested_start < covered_start
+                if backfilled:
+                    head = _download_history(
+                        symbol, start=requested_start, end=stored.index[0], interval=interval
+                    )
+                    if not head.empty:
+                        stored = pd.concat([head, stored])
+                    meta["start"] = str(requested_start.date())
+                    changed = True
+
+                # A backfilled head is on today's adjustment basis, so also check
+                # the tail for splits/dividends since the last refresh
+                refresh_interval = _refresh_interval(interval, self.refresh_interval)
+                if backfilled or time.time() - meta.get("refreshed", 0) >= refresh_interval:
+                    tail = _download_history(symbol, start=stored.index[-1], interval=interval)
+                    if _has_new_corporate_actions(tail, stored):
+                        # Yahoo re-adjusted every earlier bar, so appending would
+                        # leave a price cliff at the seam; re-download the whole range
+                        full = _download_history(
+                            symbol, start=_to_timestamp(meta["start"], tz), interval=interval
+                        )
+                        if not full.empty:
+                            stored = full
+                    elif not tail.empty:
+                        stored = pd.concat([stored, tail])
+                    meta["refreshed"] = time.time()
+                    changed = True
+
+                if changed:
+                    stored = stored[~stored.index.duplicated(keep="last")].sort_index()
+
+            if changed:
+                self.save(symbol, stored, meta, interval)
+
+        tz = stored.index.tz
+        mask = stored.index >= _to_timestamp(start, tz)
+        if end is not None:
+            mask &= stored.index < _to_timestamp(end, tz)
+        return stored[mask]
+
+
+class HistoryCache:
+    """
+    In-memory, range-aware history cache in front of a fetch function
+
+    Keeps the widest window fetched per (symbol, interval). Narrower ranges are
+    answered with a positional slice of that window and wider ranges only
+    fetch the missing head or tail. Intraday windows expire after
+    INTRADAY_CONFIG["REFRESH_INTERVAL"] instead of the daily TTL.
+    """
+
+    def __init__(self, fetch, max_entries=None, ttl=None):
+        self.fetch = fetch
+        self.max_entries = max_entries or DATA_STORE["MEMORY_CACHE_SIZE"]
+        self.ttl = DATA_STORE["REFRESH_INTERVAL"] if ttl is None else ttl
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bound(value):
+        if value is None:
+            return pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+        ts = pd.Timestamp(value)
+        return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+    @staticmethod
+    def _slice(data, start, end):
+        if data.empty:
+            return data
+        tz = data.index.tz
+        i = data.index.searchsorted(_to_timestamp(start, tz), side="left")
+        j = data.index.searchsorted(_to_timestamp(end, tz), side="left")
+        return data.iloc[i:j]
+
+    def get(self, symbol, start, end=None, interval="1d"):
+        """
+        Return bars in [start, end) for a symbol, slicing the cached window if possible
+        """
+        key = (symbol.upper(), interval)
+        start, end = self._bound(start), self._bound(end)
+
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is not None and time.time() - entry[3] >= _refresh_interval(interval, self.ttl):
+                del self._windows[key]
+                entry = None
+            if entry is not None:
+                self._windows.move_to_end(key)
+
+        if entry is None:
+            data = self.fetch(symbol, start, end, interval)
+            window = (start, end, data, time.time())
+        else:
+            window_start, window_end, data, fetched_at = entry
+            if window_start <= start and end <= window_end:
+                return self._slice(data, start, end)
+
+            parts = []
+            if start < window_start:
+                parts.append(self.fetch(symbol, start, window_start, interval))
+            parts.append(data)
+            if end > window_end:
+                parts.append(self.fetch(symbol, window_end, end, interval))
+
+            parts = [part for part in parts if not part.empty]
+            if parts:
+                data = pd.concat(parts)
+                data = data[~data.index.duplicated(keep="last")].sort_index()
+            window = (min(start, window_start), max(end, window_end), data, fetched_at)
+
+        with self._lock:
+            self._windows[key] = window
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.max_entries:
+                self._windows.popitem(last=False)
+
+        return self._slice(window[2], start, end)
+
+
+_default_store = OHLCVStore()
+_default_cache = HistoryCache(_default_store.get_history)
+
+
+def get_stock_history(symbol, start, end=None, interval="1d"):
+    """
+    Get price history for a symbol through the shared memory cache and on-disk store
+    """
+    return _default_cache.get(symbol, start, end, interval)
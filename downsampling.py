@@ -0,0 +1,129 @@
+"""
+Downsampling of chart series before Plotly traces are built
+
+Line and area traces use Largest-Triangle-Three-Buckets (LTTB), which keeps
+the visually significant points of a series. Candlestick/OHLC and volume bars
+are aggregated per bucket so every high, low and traded share is preserved.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Return the indices of the points LTTB keeps when reducing (x, y) to n_out
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # Averages of every bucket (plus the final point) are computed up front,
+    # leaving only the argmax that depends on the previous pick in the loop
+    starts = np.append(edges[:-1], n - 1)
+    counts = np.diff(np.append(starts, n))
+    avg_xs = np.add.reduceat(x, starts) / counts
+    avg_ys = np.add.reduceat(y, starts) / counts
+
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        avg_x = avg_xs[i + 1]
+        avg_y = avg_ys[i + 1]
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        area = np.abs(
+            (x[previous] - avg_x) * (bucket_y - y[previous])
+            - (x[previous] - bucket_x) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+
+    return selected
+
+
+def lttb_series(series, n_out):
+    """
+    Downsample a Series with a DatetimeIndex (NaN values are dropped first)
+
+    Returns the series unchanged when it already fits in n_out points or
+    n_out is falsy (full resolution).
+    """
+    series = series.dropna()
+    if not n_out or len(series) <= n_out:
+        return series
+
+    x = series.index.asi8 if isinstance(series.index, pd.DatetimeIndex) else np.arange(len(series))
+    return series.iloc[lttb_indices(x, series.to_numpy(dtype=np.float64), n_out)]
+
+
+def _first_valid(values, starts, ends):
+    """
+    Value of the first non-NaN element in each [start, end] bucket, else NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return np.full(len(starts), np.nan)
+    i = np.minimum(np.searchsorted(valid, starts), len(valid) - 1)
+    found = (valid[i] >= starts) & (valid[i] <= ends)
+    return np.where(found, values[valid[i]], np.nan)
+
+
+def _last_valid(values, starts, ends):
+    """
+    Value of the last non-NaN element in each [start, end] bucket, else NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if not len(valid):
+        return np.full(len(starts), np.nan)
+    j = np.maximum(np.searchsorted(valid, ends, side='right') - 1, 0)
+    found = (valid[j] >= starts) & (valid[j] <= ends)
+    return np.where(found, values[valid[j]], np.nan)
+
+
+def aggregate_ohlc(data, n_out):
+    """
+    Aggregate OHLCV bars into at most n_out buckets of consecutive bars
+
+    Each bucket keeps the first Open, highest High, lowest Low, last Close and
+    total Volume, and is labelled with the timestamp of its first bar. NaN
+    bars are skipped, so a bucket is only NaN when all its bars are.
+    Returns data unchanged when it already fits or n_out is falsy.
+    """
+    n = len(data)
+    if not n_out or n <= n_out:
+        return data
+
+    starts = np.unique((np.arange(n_out) * n) // n_out)
+    ends = np.append(starts[1:], n) - 1
+
+    aggregated = {}
+    if 'Open' in data.columns:
+        aggregated['Open'] = _first_valid(data['Open'].to_numpy(), starts, ends)
+    if 'High' in data.columns:
+        aggregated['High'] = np.fmax.reduceat(data['High'].to_numpy(), starts)
+    if 'Low' in data.columns:
+        aggregated['Low'] = np.fmin.reduceat(data['Low'].to_numpy(), starts)
+    if 'Close' in data.columns:
+        aggregated['Close'] = _last_valid(data['Close'].to_numpy(), starts, ends)
+    if 'Volume' in data.columns:
+        volume = data['Volume'].to_numpy()
+        if volume.dtype.kind == 'f':
+            volume = np.nan_to_num(volume)
+        aggregated['Volume'] = np.add.reduceat(volume, starts)
+
+    return pd.DataFrame(aggregated, index=data.index[starts])
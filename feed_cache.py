@@ -0,0 +1,126 @@
+"""
+HTTP-aware RSS feed cache for the news scraper
+
+Parsed feeds are cached by URL for NEWS_SOURCES["CACHE_DURATION"] seconds.
+Expired feeds are revalidated with a conditional GET (ETag and
+If-Modified-Since); a 304 Not Modified answer renews the cached entry without
+downloading or parsing the feed again.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import feedparser
+import requests
+
+from config import NEWS_SOURCES
+from rss_parser import parse_feed
+
+
+class FeedCache:
+    """
+    Bounded LRU cache of parsed feed entries with TTL and conditional revalidation
+    """
+
+    def __init__(self, ttl=None, max_size=None, timeout=None):
+        self.ttl = NEWS_SOURCES["CACHE_DURATION"] if ttl is None else ttl
+        self.max_size = max_size or NEWS_SOURCES["FEED_CACHE_SIZE"]
+        self.timeout = NEWS_SOURCES["TIMEOUT"] if timeout is None else timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.downloads = 0
+        self.evictions = 0
+
+    def _store(self, url, entries, etag, modified):
+        with self._lock:
+            self._entries[url] = {
+                "entries": entries,
+                "etag": etag,
+                "modified": modified,
+                "fetched_at": time.time()
+            }
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, url):
+        """
+        Return the first NEWS_SOURCES["MAX_ARTICLES"] parsed entries of a feed,
+        downloading it only when it changed
+        """
+        with self._lock:
+            cached = self._entries.get(url)
+            if cached is not None:
+                self._entries.move_to_end(url)
+                if time.time() - cached["fetched_at"] < self.ttl:
+                    self.hits += 1
+                    return cached["entries"]
+
+        headers = {"User-Agent": feedparser.USER_AGENT}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["modified"]:
+                headers["If-Modified-Since"] = cached["modified"]
+
+        response = requests.get(url, timeout=self.timeout, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._store(url, cached["entries"], cached["etag"], cached["modified"])
+            with self._lock:
+                self.not_modified += 1
+            return cached["entries"]
+
+        response.raise_for_status()
+        entries = parse_feed(response.content, NEWS_SOURCES["MAX_ARTICLES"])
+        self._store(
+            url, entries, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        with self._lock:
+            self.downloads += 1
+        return entries
+
+    def invalidate(self, url=None):
+        """
+        Drop one feed, or every feed if no URL is given
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(url, None)
+
+    def stats(self):
+        """
+        Return hit/revalidation counters and the current cache size
+        """
+        with self._lock:
+            lookups = self.hits + self.not_modified + self.downloads
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "not_modified": self.not_modified,
+                "downloads": self.downloads,
+                "hit_rate": (self.hits + self.not_modified) / lookups if lookups else 0,
+                "evictions": self.evictions
+            }
+
+
+_feed_cache = FeedCache()
+
+
+def get_feed_entries(url):
+    """
+    Get the parsed entries of an RSS feed through the shared feed cache
+    """
+    return _feed_cache.get(url)
+
+
+def get_feed_cache_stats():
+    """
+    Get hit/revalidation counters for the feed cache
+    """
+    return _feed_cache.stats()
@@ -0,0 +1,121 @@
+"""
+Process-wide Gemini client for the chatbot
+
+google.generativeai keeps its API client in module-level state, so calling
+configure() and building a GenerativeModel on every chat message throws away
+the underlying connection each time. GeminiClientManager configures the
+library once per process, keeps one model handle per model name and is safe
+to share between concurrent Streamlit sessions. It also times client
+construction separately from requests.
+"""
+
+import threading
+import time
+
+import google.generativeai as genai
+
+from config import CHATBOT_CONFIG
+
+
+class GeminiClientManager:
+    """
+    Configure-once Gemini client with pooled model handles and timing metrics
+    """
+
+    def __init__(self, api_key, api_endpoint=None, transport=None):
+        self.api_key = api_key
+        self.api_endpoint = api_endpoint or CHATBOT_CONFIG["API_ENDPOINT"]
+        self.transport = transport or CHATBOT_CONFIG["TRANSPORT"]
+        self._models = {}
+        self._configured = False
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self.construction_seconds = 0.0
+        self.models_created = 0
+        self.requests = 0
+        self.request_errors = 0
+        self.request_seconds = 0.0
+
+    def _configure(self):
+        options = {"api_key": self.api_key}
+        if self.api_endpoint:
+            # e.g. a local stand-in server: http://127.0.0.1:8000 with transport "rest"
+            options["client_options"] = {"api_endpoint": self.api_endpoint}
+        if self.transport:
+            options["transport"] = self.transport
+        genai.configure(**options)
+        self._configured = True
+
+    def model(self, model_name=None):
+        """
+        Return the shared GenerativeModel for a model name, creating it once
+        """
+        model_name = model_name or CHATBOT_CONFIG["MODEL"]
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                started = time.perf_counter()
+                if not self._configured:
+                    self._configure()
+                model = genai.GenerativeModel(model_name=model_name)
+                self._models[model_name] = model
+                with self._metrics_lock:
+                    self.construction_seconds += time.perf_counter() - started
+                    self.models_created += 1
+            return model
+
+    def generate(self, prompt, model_name=None):
+        """
+        Generate a response for prompt and return its text
+        """
+        model = self.model(model_name)
+        started = time.perf_counter()
+        try:
+            response = model.generate_content(
+                prompt, request_options={"timeout": CHATBOT_CONFIG["RESPONSE_TIMEOUT"]}
+            )
+            return response.text
+        except Exception:
+            with self._metrics_lock:
+                self.request_errors += 1
+            raise
+        finally:
+            with self._metrics_lock:
+                self.requests += 1
+                self.request_seconds += time.perf_counter() - started
+
+    def stats(self):
+        """
+        Return client construction time versus request time
+        """
+        with self._metrics_lock:
+            return {
+                "models": self.models_created,
+                "construction_seconds": self.construction_seconds,
+                "requests": self.requests,
+                "request_errors": self.request_errors,
+                "request_seconds": self.request_seconds,
+                "mean_request_seconds": self.request_seconds / self.requests if self.requests else 0
+            }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_gemini_client(api_key):
+    """
+    Get the process-wide client manager, created with api_key on first use
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GeminiClientManager(api_key)
+        return _client
+
+
+def get_gemini_client_stats():
+    """
+    Get client construction versus request timing, or None before first use
+    """
+    return _client.stats() if _client is not None else None
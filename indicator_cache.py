@@ -0,0 +1,133 @@
+"""
+Content-addressed memoization of technical indicator results
+
+Results are keyed by a fingerprint of the input frame's bytes plus the
+indicator parameters, so Streamlit reruns on identical data cost a hash of the
+input instead of a full recompute. The cache is process-wide (shared by all
+sessions) and evicts least recently used results beyond a memory cap.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from config import INDICATOR_CACHE
+from technical_indicators import calculate_technical_indicators, resolve_indicator_columns
+
+
+def frame_fingerprint(data):
+    """
+    Hash a DataFrame's index, column labels, dtypes and values
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((data.shape, list(data.columns), [str(t) for t in data.dtypes])).encode())
+    digest.update(str(getattr(data.index, "tz", None)).encode())
+
+    index_values = np.asarray(data.index.values)
+    if index_values.dtype.kind == "M":
+        index_values = index_values.view("i8")
+    if index_values.dtype == object:
+        digest.update(repr(index_values.tolist()).encode())
+    else:
+        digest.update(memoryview(np.ascontiguousarray(index_values)).cast("B"))
+
+    for column in data.columns:
+        values = data[column].to_numpy()
+        if values.dtype == object:
+            digest.update(repr(values.tolist()).encode())
+        else:
+            digest.update(memoryview(np.ascontiguousarray(values)).cast("B"))
+
+    return digest.hexdigest()
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU cache of indicator frames bounded by total memory
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes or INDICATOR_CACHE["MAX_BYTES"]
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = int(value.memory_usage(index=True, deep=False).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Return hit/miss counters and memory usage
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0,
+                "evictions": self.evictions
+            }
+
+
+_indicator_cache = IndicatorCache()
+
+
+def cached_technical_indicators(data, sma_period=20, ema_period=12, indicators=None,
+                                compact=False):
+    """
+    calculate_technical_indicators memoized on the content of data
+
+    The returned frame is shared between callers and must not be modified.
+    """
+    key = (
+        frame_fingerprint(data), sma_period, ema_period,
+        tuple(resolve_indicator_columns(indicators)), compact
+    )
+
+    result = _indicator_cache.get(key)
+    if result is None:
+        result = calculate_technical_indicators(data, sma_period, ema_period, indicators, compact)
+        _indicator_cache.put(key, result)
+    return result
+
+
+def get_indicator_cache_stats():
+    """
+    Get hit/miss counters for the indicator cache
+    """
+    return _indicator_cache.stats()
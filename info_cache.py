@@ -0,0 +1,132 @@
+"""
+Company information cache for the Stock Dashboard application
+
+stock.info is the slowest Yahoo Finance call and the fields it returns change
+at most daily, so it is cached with a TTL. Expired entries are still served
+immediately while a background thread refreshes them (stale-while-revalidate).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import yfinance as yf
+
+from config import INFO_CACHE
+
+
+class SWRCache:
+    """
+    Bounded LRU cache with TTL and stale-while-revalidate refreshes
+    """
+
+    def __init__(self, loader, ttl=None, max_size=None, max_workers=2):
+        self.loader = loader
+        self.ttl = INFO_CACHE["TTL"] if ttl is None else ttl
+        self.max_size = max_size or INFO_CACHE["MAX_SIZE"]
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="swr-refresh"
+        )
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+
+    def _store(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _refresh(self, key):
+        try:
+            self._store(key, self.loader(key))
+            with self._lock:
+                self.refreshes += 1
+        except Exception:
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get(self, key):
+        """
+        Return the cached value for key, loading it synchronously on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                value, stored_at = entry
+                if time.time() - stored_at < self.ttl:
+                    self.hits += 1
+                    return value
+
+                self.stale_hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._executor.submit(self._refresh, key)
+                return value
+
+            self.misses += 1
+
+        value = self.loader(key)
+        self._store(key, value)
+        return value
+
+    def invalidate(self, key=None):
+        """
+        Drop one entry, or every entry if no key is given
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """
+        Return hit/miss counters and the current cache size
+        """
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "evictions": self.evictions
+            }
+
+
+def _load_company_info(symbol):
+    return yf.Ticker(symbol).info or {}
+
+
+_info_cache = SWRCache(_load_company_info)
+
+
+def get_company_info(symbol):
+    """
+    Get company information (stock.info) for a symbol through the shared cache
+    """
+    return _info_cache.get(symbol.upper())
+
+
+def get_info_cache_stats():
+    """
+    Get hit/miss counters for the company information cache
+    """
+    return _info_cache.stats()
@@ -0,0 +1,120 @@
+"""
+Vectorized sliding-window kernels for the technical indicators
+
+Every kernel works along the first axis of a 1-D (time) or 2-D
+(time x symbols) float array and returns an array of the same shape, with
+NaN for the first window - 1 rows and for any window that contains a NaN,
+matching pandas rolling(window).<agg>() defaults.
+"""
+
+import numpy as np
+
+
+def _as_float_array(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+def _empty_like(values):
+    return np.full(values.shape, np.nan, dtype=np.float64)
+
+
+def rolling_mean_std(values, window, ddof=1):
+    """
+    Rolling mean and standard deviation
+
+    Runs Welford's update for all windows at once: step k folds the k-th
+    element of every window into that window's running mean and M2, so the
+    cost is window vectorized passes and memory stays O(n).
+    """
+    values = _as_float_array(values)
+    mean_out = _empty_like(values)
+    std_out = _empty_like(values)
+    n = values.shape[0]
+    if window < 1 or n < window:
+        return mean_out, std_out
+
+    m = n - window + 1
+    mean = np.zeros((m,) + values.shape[1:])
+    m2 = np.zeros_like(mean)
+    for k in range(window):
+        x = values[k:k + m]
+        delta = x - mean
+        mean += delta / (k + 1)
+        m2 += delta * (x - mean)
+
+    mean_out[window - 1:] = mean
+    if window > ddof:
+        std_out[window - 1:] = np.sqrt(np.maximum(m2, 0.0) / (window - ddof))
+    return mean_out, std_out
+
+
+def rolling_std(values, window, ddof=1):
+    """
+    Rolling sample standard deviation (Welford)
+    """
+    return rolling_mean_std(values, window, ddof)[1]
+
+
+def rolling_mean_abs_deviation(values, window):
+    """
+    Rolling mean absolute deviation around each window's own mean
+
+    Equivalent to rolling(window).apply(lambda x: np.abs(x - x.mean()).mean())
+    without a Python call per window.
+    """
+    values = _as_float_array(values)
+    out = _empty_like(values)
+    n = values.shape[0]
+    if window < 1 or n < window:
+        return out
+
+    m = n - window + 1
+    mean = rolling_mean_std(values, window)[0][window - 1:]
+    total = np.zeros_like(mean)
+    for k in range(window):
+        total += np.abs(values[k:k + m] - mean)
+
+    out[window - 1:] = total / window
+    return out
+
+
+def _rolling_extreme(values, window, combine):
+    """
+    Rolling min/max with the van Herk/Gil-Werman block algorithm
+
+    This is the vectorized counterpart of a monotonic deque: O(n) work in
+    three array passes, independent of the window length.
+    """
+    values = _as_float_array(values)
+    out = _empty_like(values)
+    n = values.shape[0]
+    if window < 1 or n < window:
+        return out
+
+    blocks = -(-n // window)
+    pad = blocks * window - n
+    padded = np.concatenate([values, np.full((pad,) + values.shape[1:], np.nan)])
+    shaped = padded.reshape((blocks, window) + values.shape[1:])
+
+    prefix = combine.accumulate(shaped, axis=1).reshape(padded.shape)
+    suffix = combine.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+
+    # A window either is a whole block or spans the tail of one block and the
+    # head of the next, so it is covered exactly by one suffix and one prefix
+    result = combine(suffix[:n - window + 1], prefix[window - 1:n])
+    out[window - 1:] = result
+    return out
+
+
+def rolling_max(values, window):
+    """
+    Rolling maximum
+    """
+    return _rolling_extreme(values, window, np.maximum)
+
+
+def rolling_min(values, window):
+    """
+    Rolling minimum
+    """
+    return _rolling_extreme(values, window, np.minimum)
@@ -0,0 +1,198 @@
+"""
+Near-duplicate news article detection for the Stock Dashboard application
+
+Every article gets a stable id. Articles whose canonical link (tracking
+parameters, fragments and "www." removed) or SimHash of the normalized title
+and summary matches an article seen before get that article's id, so the
+same story syndicated under a slightly different headline or link is
+recognized. The seen-index lives in SQLite and is shared by all sessions and
+processes; lookups are primary-key and indexed band queries, independent of
+how many articles have been seen.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import NEWS_DEDUP
+
+SIMHASH_BITS = 64
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "ncid", "ref", "referrer",
+    "guccounter", "guce_referrer", "guce_referrer_sig", ".tsrc", "soc_src", "soc_trk", "yptr"
+}
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def canonical_link(url):
+    """
+    Normalize an article URL so syndicated and tracked copies compare equal
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(query), ""))
+
+
+def normalize_text(text):
+    """
+    Lowercase words of a text with markup and punctuation removed
+    """
+    return _WORD.findall(_TAG.sub(" ", text or "").lower())
+
+
+def simhash(words):
+    """
+    64-bit SimHash over word unigrams and bigrams
+    """
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _bands(fingerprint, bands):
+    """
+    Split a fingerprint into equal bit bands; fingerprints within bands - 1
+    differing bits share at least one band exactly
+    """
+    width = SIMHASH_BITS // bands
+    mask = (1 << width) - 1
+    return [(fingerprint >> (i * width)) & mask for i in range(bands)]
+
+
+def _signed(value):
+    # SQLite integers are signed 64-bit
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+class SeenIndex:
+    """
+    Persistent SQLite index mapping canonical links and SimHash bands to article ids
+    """
+
+    def __init__(self, path=None, max_distance=None):
+        self.path = path or NEWS_DEDUP["DATABASE"]
+        self.max_distance = NEWS_DEDUP["MAX_DISTANCE"] if max_distance is None else max_distance
+        self.bands = self.max_distance + 1
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS seen_articles (
+                    id TEXT PRIMARY KEY, simhash INTEGER, first_seen REAL
+                );
+                CREATE TABLE IF NOT EXISTS seen_links (
+                    link TEXT PRIMARY KEY, id TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS seen_bands (
+                    band INTEGER NOT NULL, value INTEGER NOT NULL, id TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS seen_bands_lookup ON seen_bands (band, value);
+            """)
+            self._conn = conn
+        return self._conn
+
+    def _near_duplicate(self, conn, fingerprint):
+        for band, value in enumerate(_bands(fingerprint, self.bands)):
+            rows = conn.execute(
+                "SELECT a.id, a.simhash FROM seen_bands b JOIN seen_articles a ON a.id = b.id "
+                "WHERE b.band = ? AND b.value = ?", (band, value)
+            )
+            for article_id, other in rows:
+                if bin((other & ((1 << 64) - 1)) ^ fingerprint).count("1") <= self.max_distance:
+                    return article_id
+        return None
+
+    def article_id(self, title, summary="", link=""):
+        """
+        Return the id of the first article seen that matches this one, registering
+        the article under a new id if none does
+        """
+        link = canonical_link(link)
+        words = normalize_text(f"{title} {summary}")
+        fingerprint = simhash(words) if words else None
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if link:
+                    row = conn.execute("SELECT id FROM seen_links WHERE link = ?", (link,)).fetchone()
+                    if row:
+                        return row[0]
+
+                article_id = None
+                if fingerprint is not None:
+                    article_id = self._near_duplicate(conn, fingerprint)
+
+                if article_id is None:
+                    key = link or " ".join(words) or title or ""
+                    article_id = hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+                    inserted = conn.execute(
+                        "INSERT OR IGNORE INTO seen_articles (id, simhash, first_seen) VALUES (?, ?, ?)",
+                        (article_id, None if fingerprint is None else _signed(fingerprint), time.time())
+                    ).rowcount
+                    if inserted and fingerprint is not None:
+                        conn.executemany(
+                            "INSERT INTO seen_bands (band, value, id) VALUES (?, ?, ?)",
+                            [(band, value, article_id)
+                             for band, value in enumerate(_bands(fingerprint, self.bands))]
+                        )
+
+                # Later copies with this link resolve by primary key
+                if link:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO seen_links (link, id) VALUES (?, ?)", (link, article_id)
+                    )
+                return article_id
+
+
+_seen_index = SeenIndex()
+
+
+def dedupe_articles(articles):
+    """
+    Drop near-duplicate articles, keeping the first copy of each story
+
+    Each kept article gets an 'id' shared by every copy of the story across
+    calls, sessions and processes. Falls back to exact titles if the index
+    cannot be used.
+    """
+    seen = set()
+    unique = []
+    for article in articles:
+        try:
+            article_id = _seen_index.article_id(
+                article.get('title', ''), article.get('summary', ''), article.get('link', '')
+            )
+        except sqlite3.Error as e:
+            print(f"Error using news dedup index: {e}")
+            article_id = article.get('title', '')
+        if article_id not in seen:
+            seen.add(article_id)
+            unique.append(dict(article, id=article_id))
+    return unique
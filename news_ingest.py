@@ -0,0 +1,195 @@
+"""
+Background news ingestion for the Stock Dashboard application
+
+A daemon thread periodically scrapes news for the default symbols and every
+registered (watchlisted) symbol into the local article store, so the News
+tab reads from SQLite and its latency no longer depends on Yahoo. Other
+symbols are ingested on a background executor when first read, and scrapes
+that come back empty are retried with exponential backoff.
+"""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from config import DEFAULT_STOCK_SYMBOLS, NEWS_STORE
+from news_scraper import get_stock_news
+from news_store import get_article_store
+from thumbnail_cache import warm_thumbnails
+
+_store = get_article_store()
+
+# Watchlist count per symbol across all sessions, shared by the whole process
+_registered_symbols = Counter()
+_registry_lock = threading.Lock()
+
+_worker = None
+_worker_lock = threading.Lock()
+
+_executor = ThreadPoolExecutor(
+    max_workers=NEWS_STORE["MAX_WORKERS"], thread_name_prefix="news-ingest-on-demand"
+)
+
+# Last scrape attempt per symbol: (attempted_at, consecutive empty scrapes)
+_attempts = {}
+_pending = set()
+_attempts_lock = threading.Lock()
+
+
+def register_symbols(symbols):
+    """
+    Add symbols (once per watching session) to those the ingestion worker
+    keeps up to date
+    """
+    with _registry_lock:
+        _registered_symbols.update(symbol.upper() for symbol in symbols)
+
+
+def unregister_symbols(symbols):
+    """
+    Release symbols added with register_symbols; a symbol stays tracked
+    while any other session still watches it
+    """
+    with _registry_lock:
+        _registered_symbols.subtract(symbol.upper() for symbol in symbols)
+        for symbol in [symbol for symbol, count in _registered_symbols.items() if count <= 0]:
+            del _registered_symbols[symbol]
+
+
+def tracked_symbols():
+    """
+    Symbols ingested in the background: defaults first, then registered symbols
+    """
+    symbols = list(DEFAULT_STOCK_SYMBOLS.values())
+    with _registry_lock:
+        symbols += sorted(set(_registered_symbols).difference(symbols))
+    return symbols
+
+
+def _retry_delay(failures):
+    """
+    Seconds to wait after failures consecutive empty scrapes: doubles from
+    NEWS_STORE["RETRY_AFTER"] up to the ingestion interval
+    """
+    return min(NEWS_STORE["RETRY_AFTER"] * 2 ** (failures - 1), NEWS_STORE["INGEST_INTERVAL"])
+
+
+def needs_ingestion(symbol, interval=None):
+    """
+    Whether a symbol is due for a scrape: not ingested within interval and
+    not backing off after an empty scrape
+    """
+    symbol = symbol.upper()
+    interval = NEWS_STORE["INGEST_INTERVAL"] if interval is None else interval
+    now = time.time()
+    ingested_at = _store.ingested_at(symbol)
+    if ingested_at is not None and now - ingested_at < interval:
+        return False
+    with _attempts_lock:
+        attempted_at, failures = _attempts.get(symbol, (None, 0))
+    return not failures or now - attempted_at >= _retry_delay(failures)
+
+
+def ingest_symbol(symbol):
+    """
+    Scrape the latest news for a symbol into the article store
+
+    get_stock_news returns no articles when every source failed or timed
+    out, so the symbol is only marked as ingested if something came back;
+    otherwise the attempt is recorded and retried with backoff. Thumbnails
+    of the article images are downloaded in the background.
+    """
+    symbol = symbol.upper()
+    articles = get_stock_news(symbol)
+    with _attempts_lock:
+        failures = 0 if articles else _attempts.get(symbol, (None, 0))[1] + 1
+        _attempts[symbol] = (time.time(), failures)
+    if articles:
+        _store.add_articles(symbol, articles)
+        warm_thumbnails(article.get('image') for article in articles)
+    return len(articles)
+
+
+def _ingest_pending(symbol):
+    try:
+        ingest_symbol(symbol)
+    except Exception as e:
+        print(f"Error ingesting news for {symbol}: {e}")
+    finally:
+        with _attempts_lock:
+            _pending.discard(symbol)
+
+
+def request_ingestion(symbol):
+    """
+    Queue a background scrape for a symbol unless one is already pending
+    """
+    symbol = symbol.upper()
+    with _attempts_lock:
+        if symbol in _pending:
+            return
+        _pending.add(symbol)
+    _executor.submit(_ingest_pending, symbol)
+
+
+def is_ingestion_pending(symbol):
+    """
+    Whether a background scrape for a symbol is queued or running
+    """
+    with _attempts_lock:
+        return symbol.upper() in _pending
+
+
+class IngestionWorker(threading.Thread):
+    """
+    Daemon thread that ingests every tracked symbol once per interval
+    """
+
+    def __init__(self, interval=None):
+        super().__init__(name="news-ingest", daemon=True)
+        self.interval = NEWS_STORE["INGEST_INTERVAL"] if interval is None else interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            for symbol in tracked_symbols():
+                if self._stop_event.is_set():
+                    break
+                if not needs_ingestion(symbol, self.interval):
+                    continue  # refreshed elsewhere, or backing off after an empty scrape
+                try:
+                    ingest_symbol(symbol)
+                except Exception as e:
+                    print(f"Error ingesting news for {symbol}: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def start_news_ingestion():
+    """
+    Start the process-wide ingestion worker if it is not running yet
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = IngestionWorker()
+            _worker.start()
+        return _worker
+
+
+def get_symbol_news(symbol, limit=None):
+    """
+    Get the latest stored news for a symbol without waiting on Yahoo
+
+    Symbols the worker does not track, or has not reached yet, are queued for
+    a background scrape when they are due (see needs_ingestion); the stored
+    articles are returned immediately either way.
+    """
+    symbol = symbol.upper()
+    untracked = symbol not in tracked_symbols() or _store.ingested_at(symbol) is None
+    if untracked and needs_ingestion(symbol):
+        request_ingestion(symbol)
+    return _store.latest(symbol, limit)
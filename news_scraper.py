@@ -1,60 +1,161 @@
-import requests
 import yfinance as yf
 from datetime import datetime
-import feedparser
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from config import NEWS_SOURCES
+from feed_cache import get_feed_entries
+from news_dedup import dedupe_articles
+from news_store import search_articles
+
+_executor = ThreadPoolExecutor(max_workers=NEWS_SOURCES["MAX_WORKERS"], thread_name_prefix="news")
+
+# Latency and outcome of the most recent fetch of each source, most recent last
+_source_stats = OrderedDict()
+_source_stats_lock = threading.Lock()
+_MAX_SOURCE_STATS = 256
+
+_HTML_TAG = re.compile(r'<[^>]+>')
+_IMG_SRC = re.compile(r'<img[^>]+src="([^"]+)"')
+_MASK_DIGITS = str.maketrans('123456789', '000000000')
+
+# Yahoo's RFC 822 pubDate, parsed without strptime on the fast path
+_RFC822_DATE = re.compile(
+    r'[A-Z][a-z]{2}, (\d{2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) [+-](\d{2})(\d{2})$'
+)
+_MONTHS = {name: number for number, name in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1
+)}
+
+# Date "shape" (digits masked) -> index of the first parser in RSS_DATE_PARSERS that handled it
+_date_formats = {}
+_MAX_DATE_SHAPES = 256
+
+def _timed(fetch):
+    """
+    Run a source fetch and return (seconds taken, result, error)
+    """
+    started = time.perf_counter()
+    try:
+        return time.perf_counter() - started, fetch(), None
+    except Exception as e:
+        return time.perf_counter() - started, None, e
+
+def _record_source(name, latency, status):
+    with _source_stats_lock:
+        _source_stats.pop(name, None)
+        _source_stats[name] = {'latency': latency, 'status': status, 'fetched_at': time.time()}
+        while len(_source_stats) > _MAX_SOURCE_STATS:
+            _source_stats.popitem(last=False)
+
+def fetch_news_sources(sources, deadline=None):
+    """
+    Fetch several news sources concurrently under one total deadline
+
+    sources maps a source name to a callable returning a list of articles.
+    Returns a dict with the articles of every source that succeeded before the
+    deadline, in the order of sources; slow sources keep running in the
+    background but are left out.
+    """
+    deadline = NEWS_SOURCES["DEADLINE"] if deadline is None else deadline
+    futures = {name: _executor.submit(_timed, fetch) for name, fetch in sources.items()}
+    wait(futures.values(), timeout=deadline)
+
+    results = {}
+    for name, future in futures.items():
+        if not future.done():
+            future.cancel()
+            _record_source(name, deadline, 'timeout')
+            continue
+
+        latency, articles, error = future.result()
+        if error is not None:
+            print(f"Error fetching news from {name}: {error}")
+            _record_source(name, latency, 'error')
+        else:
+            _record_source(name, latency, 'ok')
+            results[name] = articles
+    return results
+
+def get_news_source_stats():
+    """
+    Get latency (seconds) and status of the most recent fetch of each news source
+    """
+    with _source_stats_lock:
+        return {name: dict(stats) for name, stats in _source_stats.items()}
+
+def _rss_articles(url, limit):
+    """
+    Get an RSS feed through the feed cache and convert its first entries to articles
+    """
+    return normalize_entries(get_feed_entries(url)[:limit])
+
+def normalize_entries(entries, source='Yahoo Finance'):
+    """
+    Convert raw RSS entries (feedparser or rss_parser dicts) to article dicts
+
+    This is the normalization step shared by the feed fetchers, the ingestion
+    worker and backfills: one pass over the entries with precompiled patterns,
+    detecting each date format once per shape of date string.
+    """
+    articles = []
+    for entry in entries:
+        articles.append({
+            'title': entry.get('title', 'No title'),
+            'summary': clean_text(entry.get('summary', 'No summary available')),
+            'link': entry.get('link', ''),
+            'published': format_rss_date(entry.get('published', '')),
+            'source': source,
+            'image': extract_image_from_content(entry.get('content', []))
+        })
+    return articles
+
+def _yfinance_articles(symbol, limit):
+    """
+    Convert the news attached to a yfinance Ticker to articles
+    """
+    articles = []
+    for article in yf.Ticker(symbol).news[:limit]:
+        articles.append({
+            'title': article.get('title', 'No title'),
+            'summary': clean_text(article.get('summary', 'No summary available')),
+            'link': article.get('link', ''),
+            'published': format_timestamp(article.get('providerPublishTime', 0)),
+            'source': article.get('publisher', 'Unknown'),
+            'image': article.get('thumbnail', {}).get('resolutions', [{}])[-1].get('url', '') if article.get('thumbnail') else ''
+        })
+    return articles
+
+def _collect(sources, deadline=None):
+    """
+    Fetch sources concurrently and concatenate their articles in source order
+    """
+    results = fetch_news_sources(sources, deadline)
+    return [article for name in sources for article in results.get(name, [])]
 
 def get_stock_news(symbol):
     """
     Get news articles for a specific stock symbol
     """
-    news_articles = []
-    
     try:
-        # Method 1: Using yfinance news
-        stock = yf.Ticker(symbol)
-        news = stock.news
-        
-        for article in news[:10]:  # Get top 10 articles
-            news_articles.append({
-                'title': article.get('title', 'No title'),
-                'summary': clean_text(article.get('summary', 'No summary available')),
-                'link': article.get('link', ''),
-                'published': format_timestamp(article.get('providerPublishTime', 0)),
-                'source': article.get('publisher', 'Unknown'),
-                'image': article.get('thumbnail', {}).get('resolutions', [{}])[-1].get('url', '') if article.get('thumbnail') else ''
-            })
-        
-        # Method 2: RSS feeds for additional news
+        # yfinance news plus RSS feeds for additional news, fetched concurrently
+        sources = {f"yfinance:{symbol}": partial(_yfinance_articles, symbol, 10)}
         rss_sources = [
             f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US",
             f"https://finance.yahoo.com/rss/headline?s={symbol}"
         ]
-        
         for rss_url in rss_sources:
-            try:
-                feed = feedparser.parse(rss_url)
-                for entry in feed.entries[:5]:  # Get 5 articles from each source
-                    news_articles.append({
-                        'title': entry.get('title', 'No title'),
-                        'summary': clean_text(entry.get('summary', 'No summary available')),
-                        'link': entry.get('link', ''),
-                        'published': format_rss_date(entry.get('published', '')),
-                        'source': 'Yahoo Finance',
-                        'image': extract_image_from_content(entry.get('content', []))
-                    })
-            except:
-                continue
+            sources[rss_url] = partial(_rss_articles, rss_url, 5)  # 5 articles from each source
+        news_articles = _collect(sources)
         
-        # Remove duplicates based on title
-        seen_titles = set()
-        unique_articles = []
-        for article in news_articles:
-            if article['title'] not in seen_titles:
-                seen_titles.add(article['title'])
-                unique_articles.append(article)
+        # Remove near-duplicates (same story under another title or tracked link)
+        unique_articles = dedupe_articles(news_articles)
         
-        return unique_articles[:15]  # Return top 15 unique articles
+        return unique_articles[:NEWS_SOURCES["MAX_ARTICLES"]]
     
     except Exception as e:
         print(f"Error fetching news: {e}")
@@ -68,7 +169,7 @@ def clean_text(text):
         return "No content available"
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG.sub('', text)
     
     # Remove extra whitespace
     text = ' '.join(text.split())
@@ -90,23 +191,54 @@ def format_timestamp(timestamp):
     except:
         return "Unknown date"
 
+def _parse_rfc822_date(date_str):
+    match = _RFC822_DATE.match(date_str)
+    if not match or match.group(2) not in _MONTHS:
+        raise ValueError(date_str)
+    day, month, year, hour, minute, second, offset_hours, offset_minutes = match.groups()
+    # Same range checks as strptime
+    datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+    if int(offset_hours) > 23 or int(offset_minutes) > 59:
+        raise ValueError(date_str)
+    return f"{year}-{_MONTHS[month]:02d}-{day} {hour}:{minute}"
+
+def _strptime_date(fmt, length, date_str):
+    return datetime.strptime(date_str[:length], fmt).strftime("%Y-%m-%d %H:%M")
+
+# Date parsers tried in order; each returns "YYYY-MM-DD HH:MM" or raises ValueError
+RSS_DATE_PARSERS = [
+    _parse_rfc822_date,
+    partial(_strptime_date, "%a, %d %b %Y %H:%M:%S %z", None),
+    partial(_strptime_date, "%Y-%m-%dT%H:%M:%S", 19)
+]
+
 def format_rss_date(date_str):
     """
     Format RSS date string to readable format
+
+    The parser that handles a date is remembered per shape of date string, so
+    a feed's dates after the first go straight to the right parser.
     """
-    try:
-        if date_str:
-            # Parse common RSS date formats
-            dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
-            return dt.strftime("%Y-%m-%d %H:%M")
+    if not date_str:
         return "Unknown date"
-    except:
+    
+    shape = date_str.translate(_MASK_DIGITS)
+    index = _date_formats.get(shape)
+    if index is not None:
         try:
-            # Try alternative format
-            dt = datetime.strptime(date_str[:19], "%Y-%m-%dT%H:%M:%S")
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except:
+            return RSS_DATE_PARSERS[index](date_str)
+        except ValueError:
             return "Unknown date"
+    
+    for index, parser in enumerate(RSS_DATE_PARSERS):
+        try:
+            formatted = parser(date_str)
+        except ValueError:
+            continue
+        if len(_date_formats) < _MAX_DATE_SHAPES:
+            _date_formats[shape] = index
+        return formatted
+    return "Unknown date"
 
 def extract_image_from_content(content):
     """
@@ -116,7 +248,7 @@ def extract_image_from_content(content):
         if content and isinstance(content, list) and len(content) > 0:
             content_text = content[0].get('value', '')
             # Look for image URLs in content
-            img_match = re.search(r'<img[^>]+src="([^"]+)"', content_text)
+            img_match = _IMG_SRC.search(content_text)
             if img_match:
                 return img_match.group(1)
         return ''
@@ -127,8 +259,6 @@ def get_market_news():
     """
     Get general market news
     """
-    market_news = []
-    
     try:
         # General market RSS feeds
         market_feeds = [
@@ -137,20 +267,9 @@ def get_market_news():
             "https://feeds.finance.yahoo.com/rss/2.0/headline?s=^IXIC&region=US&lang=en-US"
         ]
         
-        for feed_url in market_feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:5]:
-                    market_news.append({
-                        'title': entry.get('title', 'No title'),
-                        'summary': clean_text(entry.get('summary', 'No summary available')),
-                        'link': entry.get('link', ''),
-                        'published': format_rss_date(entry.get('published', '')),
-                        'source': 'Yahoo Finance',
-                        'image': extract_image_from_content(entry.get('content', []))
-                    })
-            except:
-                continue
+        market_news = dedupe_articles(
+            _collect({feed_url: partial(_rss_articles, feed_url, 5) for feed_url in market_feeds})
+        )
         
         return market_news[:10]
     
@@ -161,24 +280,17 @@ def get_market_news():
 def search_news_by_keyword(keyword, limit=10):
     """
     Search for news articles by keyword
+
+    Searches every archived article (see news_store) with BM25 ranking and
+    only falls back to Yahoo's RSS feed for the keyword when nothing matches.
     """
     try:
-        # This is a simplified version - in production, you might want to use
-        # news APIs like NewsAPI, Alpha Vantage, or similar services
+        articles = search_articles(keyword, limit)
+        if articles:
+            return articles
         
         search_url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={keyword}&region=US&lang=en-US"
-        feed = feedparser.parse(search_url)
-        
-        articles = []
-        for entry in feed.entries[:limit]:
-            articles.append({
-                'title': entry.get('title', 'No title'),
-                'summary': clean_text(entry.get('summary', 'No summary available')),
-                'link': entry.get('link', ''),
-                'published': format_rss_date(entry.get('published', '')),
-                'source': 'Yahoo Finance',
-                'image': extract_image_from_content(entry.get('content', []))
-            })
+        articles = _collect({search_url: partial(_rss_articles, search_url, limit)})
         
         return articles
     
@@ -0,0 +1,228 @@
+"""
+Local SQLite article store for the Stock Dashboard application
+
+Articles are stored once by their dedup id (see news_dedup) and linked to
+every symbol they were ingested for, so the News tab reads the latest
+articles for a symbol with one indexed query instead of scraping Yahoo.
+
+Titles and summaries are also indexed in an SQLite FTS5 table kept in sync
+by triggers, so keyword search is a local BM25-ranked query over every
+article ever ingested.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from config import NEWS_SOURCES, NEWS_STORE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT,
+    link TEXT,
+    published TEXT,
+    published_at REAL NOT NULL,
+    source TEXT,
+    image TEXT
+);
+CREATE TABLE IF NOT EXISTS article_symbols (
+    symbol TEXT NOT NULL,
+    article_id TEXT NOT NULL REFERENCES articles (id),
+    published_at REAL NOT NULL,
+    PRIMARY KEY (symbol, article_id)
+);
+CREATE INDEX IF NOT EXISTS article_symbols_recent ON article_symbols (symbol, published_at DESC);
+CREATE TABLE IF NOT EXISTS ingestions (
+    symbol TEXT PRIMARY KEY,
+    ingested_at REAL NOT NULL
+);
+"""
+
+# External-content FTS5 index over articles; the triggers keep it in sync
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, summary, content='articles', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary)
+    VALUES ('delete', old.rowid, old.title, old.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary)
+    VALUES ('delete', old.rowid, old.title, old.summary);
+    INSERT INTO articles_fts (rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+END;
+"""
+
+# BM25 column weights: a match in the title counts twice as much as one in the summary
+TITLE_WEIGHT = 2.0
+SUMMARY_WEIGHT = 1.0
+
+_TOKEN = re.compile(r"\w+")
+
+ARTICLE_FIELDS = ("id", "title", "summary", "link", "published", "source", "image")
+
+
+def _published_at(published, default):
+    """
+    Epoch seconds of a 'YYYY-MM-DD HH:MM' publish date (as produced by
+    format_rss_date/format_timestamp), or default if it is unknown
+    """
+    try:
+        return datetime.strptime(published, "%Y-%m-%d %H:%M").timestamp()
+    except (TypeError, ValueError):
+        return default
+
+
+class ArticleStore:
+    """
+    SQLite-backed article store indexed by symbol and publish time
+    """
+
+    def __init__(self, path=None):
+        self.path = path or NEWS_STORE["DATABASE"]
+        self._lock = threading.Lock()
+        self._conn = None
+        self.full_text = False
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self.full_text = self._create_full_text_index(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _create_full_text_index(conn):
+        """
+        Create the FTS5 index, backfilling it from existing articles the first
+        time; returns False if this SQLite build has no FTS5
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone()
+        try:
+            with conn:
+                conn.executescript(FTS_SCHEMA)
+                if not exists:
+                    conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            print(f"Full-text search unavailable: {e}")
+            return False
+        return True
+
+    def add_articles(self, symbol, articles):
+        """
+        Insert or update articles (dicts with an 'id') for a symbol and mark
+        the symbol as ingested now
+        """
+        symbol = symbol.upper()
+        now = time.time()
+        rows = []
+        for article in articles:
+            row = {field: article.get(field, '') for field in ARTICLE_FIELDS}
+            row["published_at"] = _published_at(row["published"], now)
+            rows.append(row)
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO articles (id, title, summary, link, published, published_at, source, image) "
+                    "VALUES (:id, :title, :summary, :link, :published, :published_at, :source, :image) "
+                    "ON CONFLICT (id) DO UPDATE SET title = excluded.title, summary = excluded.summary, "
+                    "image = excluded.image",
+                    rows
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO article_symbols (symbol, article_id, published_at) "
+                    "VALUES (?, ?, ?)",
+                    [(symbol, row["id"], row["published_at"]) for row in rows]
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO ingestions (symbol, ingested_at) VALUES (?, ?)", (symbol, now)
+                )
+
+    def latest(self, symbol, limit=None):
+        """
+        Return the most recently published articles for a symbol
+        """
+        limit = limit or NEWS_SOURCES["MAX_ARTICLES"]
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT a.id, a.title, a.summary, a.link, a.published, a.source, a.image "
+                "FROM article_symbols s JOIN articles a ON a.id = s.article_id "
+                "WHERE s.symbol = ? ORDER BY s.published_at DESC LIMIT ?",
+                (symbol.upper(), limit)
+            ).fetchall()
+        return [dict(zip(ARTICLE_FIELDS, row)) for row in rows]
+
+    def search(self, query, limit=10):
+        """
+        Return stored articles matching any word of query, best BM25 match first
+
+        Falls back to substring matching ordered by recency without FTS5.
+        """
+        words = _TOKEN.findall(query.lower())
+        if not words:
+            return []
+
+        with self._lock:
+            conn = self._connect()
+            if self.full_text:
+                rows = conn.execute(
+                    "SELECT a.id, a.title, a.summary, a.link, a.published, a.source, a.image "
+                    "FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid "
+                    "WHERE articles_fts MATCH ? "
+                    "ORDER BY bm25(articles_fts, ?, ?), a.published_at DESC LIMIT ?",
+                    (" OR ".join(f'"{word}"' for word in words), TITLE_WEIGHT, SUMMARY_WEIGHT, limit)
+                ).fetchall()
+            else:
+                condition = " OR ".join(["title LIKE ? OR summary LIKE ?"] * len(words))
+                patterns = [f"%{word}%" for word in words for _ in range(2)]
+                rows = conn.execute(
+                    "SELECT id, title, summary, link, published, source, image FROM articles "
+                    f"WHERE {condition} ORDER BY published_at DESC LIMIT ?",
+                    patterns + [limit]
+                ).fetchall()
+        return [dict(zip(ARTICLE_FIELDS, row)) for row in rows]
+
+    def ingested_at(self, symbol):
+        """
+        Return when a symbol was last ingested (epoch seconds), or None
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT ingested_at FROM ingestions WHERE symbol = ?", (symbol.upper(),)
+            ).fetchone()
+        return row[0] if row else None
+
+
+_article_store = ArticleStore()
+
+
+def get_article_store():
+    """
+    Get the process-wide article store
+    """
+    return _article_store
+
+
+def search_articles(query, limit=10):
+    """
+    Search every stored article by keyword, ranked by BM25
+    """
+    return _article_store.search(query, limit)
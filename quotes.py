@@ -0,0 +1,112 @@
+"""
+Multi-symbol quote fetching for the Stock Dashboard application
+
+Symbol groups (sector ETFs, market indices, watchlists) are fetched with one
+batched Yahoo Finance download. Symbols missing from the batch are retried
+individually on a bounded thread pool, and whatever arrives before the
+deadline is returned.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+import yfinance as yf
+
+from config import QUOTES_CONFIG
+
+_executor = ThreadPoolExecutor(
+    max_workers=QUOTES_CONFIG["MAX_WORKERS"], thread_name_prefix="quotes"
+)
+
+
+def _split_batch(data, symbols):
+    """
+    Split a batched yf.download frame into one history frame per symbol
+    """
+    histories = {}
+    if data is None or data.empty:
+        return histories
+
+    if isinstance(data.columns, pd.MultiIndex):
+        available = set(data.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol in available:
+                hist = data[symbol].dropna(how="all")
+                if not hist.empty:
+                    histories[symbol] = hist
+    elif len(symbols) == 1:
+        hist = data.dropna(how="all")
+        if not hist.empty:
+            histories[symbols[0]] = hist
+
+    return histories
+
+
+def _fetch_one(symbol, period, timeout):
+    return yf.Ticker(symbol).history(period=period, timeout=timeout)
+
+
+def fetch_histories(symbols, period="5d", timeout=None):
+    """
+    Fetch recent price history for several symbols at once
+
+    Returns a dict of symbol -> DataFrame containing only the symbols that
+    returned data within the timeout.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    timeout = QUOTES_CONFIG["TIMEOUT"] if timeout is None else timeout
+
+    try:
+        data = yf.download(
+            symbols, period=period, group_by="ticker",
+            threads=True, progress=False, timeout=timeout
+        )
+        histories = _split_batch(data, symbols)
+    except Exception:
+        histories = {}
+
+    missing = [symbol for symbol in symbols if symbol not in histories]
+    if missing:
+        futures = {
+            _executor.submit(_fetch_one, symbol, period, timeout): symbol
+            for symbol in missing
+        }
+        done, not_done = wait(futures, timeout=timeout)
+
+        for future in not_done:
+            future.cancel()
+
+        for future in done:
+            try:
+                hist = future.result()
+            except Exception:
+                continue
+            if hist is not None and not hist.empty:
+                histories[futures[future]] = hist
+
+    return histories
+
+
+def get_quotes(symbols, period="5d", timeout=None):
+    """
+    Get the latest close and change versus the previous close for several symbols
+    """
+    quotes = {}
+
+    for symbol, hist in fetch_histories(symbols, period, timeout).items():
+        closes = hist["Close"].dropna()
+        if closes.empty:
+            continue
+
+        current = closes.iloc[-1]
+        previous = closes.iloc[-2] if len(closes) > 1 else current
+        change = current - previous
+
+        quotes[symbol] = {
+            "price": current,
+            "previous": previous,
+            "change": change,
+            "change_pct": (change / previous) * 100 if previous != 0 else 0
+        }
+
+    return quotes
@@ -0,0 +1,73 @@
+"""
+Streaming RSS 2.0 parser for Yahoo Finance feeds
+
+feedparser builds a full object tree, sniffs encodings and sanitizes every
+element, while the news scraper only keeps a few fields of the first items.
+parse_feed streams the document with iterparse, extracts just those fields,
+stops after max_items and falls back to feedparser for anything that is not
+well-formed RSS 2.0.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+
+import feedparser
+
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# RSS item child -> entry key, named like the feedparser entry attributes
+ITEM_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "description": "summary",
+    "pubDate": "published"
+}
+
+
+class UnexpectedFeed(Exception):
+    """
+    Raised when a document is not the RSS 2.0 shape the fast path handles
+    """
+
+
+def _iter_items(content, max_items):
+    events = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+    _, root = next(events)
+    if root.tag != "rss" or not root.get("version", "").startswith("2."):
+        raise UnexpectedFeed(f"root element <{root.tag}>")
+
+    channel = None
+    count = 0
+    for event, element in events:
+        if event == "start":
+            if element.tag == "channel":
+                channel = element
+            continue
+        if element.tag != "item":
+            continue
+
+        entry = {}
+        for child in element:
+            if child.tag in ITEM_FIELDS:
+                entry[ITEM_FIELDS[child.tag]] = (child.text or "").strip()
+            elif child.tag == CONTENT_ENCODED and child.text:
+                entry["content"] = [{"value": child.text}]
+        yield entry
+
+        # Items are consumed, so drop them to keep memory flat
+        if channel is not None:
+            channel.clear()
+        count += 1
+        if max_items is not None and count >= max_items:
+            return
+
+
+def parse_feed(content, max_items=None):
+    """
+    Parse the entries of an RSS feed (bytes) into dicts with the feedparser
+    keys the scraper uses: title, link, summary, published and content
+    """
+    try:
+        return list(_iter_items(content, max_items))
+    except (ET.ParseError, UnexpectedFeed, StopIteration):
+        return feedparser.parse(content).entries[:max_items]
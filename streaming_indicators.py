@@ -0,0 +1,251 @@
+"""
+Streaming technical indicators for live and intraday updates
+
+StreamingIndicators keeps running state for every indicator produced by
+technical_indicators.calculate_technical_indicators and emits the row for a
+new bar in constant time, so refreshes do not scale with history length.
+Output matches the batch functions within floating point tolerance.
+"""
+
+import math
+from collections import deque
+
+from config import TECHNICAL_INDICATORS
+
+NAN = float("nan")
+
+
+class _RollingMean:
+    """
+    Fixed-size rolling mean with compensated summation
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.values = deque()
+        self.nan_count = 0
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def _add(self, x):
+        y = x - self.compensation
+        t = self.total + y
+        self.compensation = (t - self.total) - y
+        self.total = t
+
+    def update(self, x):
+        self.values.append(x)
+        if math.isnan(x):
+            self.nan_count += 1
+        else:
+            self._add(x)
+
+        if len(self.values) > self.period:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                self._add(-old)
+
+        if len(self.values) < self.period or self.nan_count:
+            return NAN
+        return self.total / self.period
+
+
+class _RollingMeanStd:
+    """
+    Fixed-size rolling mean and sample standard deviation (Welford add/remove)
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.values = deque()
+        self.nan_count = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def _remove(self, x):
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (x - self.mean)
+
+    def update(self, x):
+        self.values.append(x)
+        if math.isnan(x):
+            self.nan_count += 1
+        else:
+            self._add(x)
+
+        if len(self.values) > self.period:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                self._remove(old)
+
+        if len(self.values) < self.period or self.nan_count:
+            return NAN, NAN
+        variance = max(self.m2, 0.0) / (self.period - 1) if self.period > 1 else NAN
+        return self.mean, math.sqrt(variance)
+
+
+class _RollingExtreme:
+    """
+    Fixed-size rolling min or max using a monotonic deque
+    """
+
+    def __init__(self, period, use_max):
+        self.period = period
+        self.use_max = use_max
+        self.candidates = deque()
+        self.nans = deque()
+        self.index = 0
+
+    def update(self, x):
+        i = self.index
+        self.index += 1
+
+        while self.candidates and self.candidates[0][0] <= i - self.period:
+            self.candidates.popleft()
+        while self.nans and self.nans[0] <= i - self.period:
+            self.nans.popleft()
+
+        if math.isnan(x):
+            self.nans.append(i)
+        else:
+            if self.use_max:
+                while self.candidates and self.candidates[-1][1] <= x:
+                    self.candidates.pop()
+            else:
+                while self.candidates and self.candidates[-1][1] >= x:
+                    self.candidates.pop()
+            self.candidates.append((i, x))
+
+        if self.index < self.period or self.nans:
+            return NAN
+        return self.candidates[0][1]
+
+
+class _EWMean:
+    """
+    Exponentially weighted mean matching pandas ewm(span=..., adjust=True)
+    """
+
+    def __init__(self, span):
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def update(self, x):
+        self.numerator *= self.decay
+        self.denominator *= self.decay
+        if not math.isnan(x):
+            self.numerator += x
+            self.denominator += 1.0
+        return self.numerator / self.denominator if self.denominator else NAN
+
+
+def _divide(a, b):
+    """
+    Divide with IEEE semantics (inf/nan instead of ZeroDivisionError)
+    """
+    if b == 0:
+        if a == 0 or math.isnan(a):
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+class StreamingIndicators:
+    """
+    Stateful indicator engine with constant-time per-bar updates
+    """
+
+    def __init__(self, sma_period=20, ema_period=12):
+        params = TECHNICAL_INDICATORS
+        self.bollinger_std = params["BOLLINGER_STD"]
+
+        self._sma = _RollingMean(sma_period)
+        self._ema = _EWMean(ema_period)
+        self._bollinger = _RollingMeanStd(params["BOLLINGER_PERIOD"])
+        self._gain = _RollingMean(params["RSI_PERIOD"])
+        self._loss = _RollingMean(params["RSI_PERIOD"])
+        self._macd_fast = _EWMean(params["MACD_FAST"])
+        self._macd_slow = _EWMean(params["MACD_SLOW"])
+        self._macd_signal = _EWMean(params["MACD_SIGNAL"])
+        self._low_min = _RollingExtreme(params["STOCHASTIC_K"], use_max=False)
+        self._high_max = _RollingExtreme(params["STOCHASTIC_K"], use_max=True)
+        self._stoch_d = _RollingMean(params["STOCHASTIC_D"])
+        self._atr = _RollingMean(params["ATR_PERIOD"])
+        self._volume_sma = _RollingMean(params["VOLUME_SMA_PERIOD"])
+        self._prev_close = NAN
+
+    @classmethod
+    def from_history(cls, data, sma_period=20, ema_period=12):
+        """
+        Create an engine warmed up on an existing OHLCV DataFrame
+        """
+        engine = cls(sma_period, ema_period)
+        for bar in data[["Open", "High", "Low", "Close", "Volume"]].itertuples(index=False):
+            engine.update(bar._asdict())
+        return engine
+
+    def update(self, bar):
+        """
+        Consume one OHLCV bar (mapping with Open/High/Low/Close/Volume) and
+        return the indicator values for it
+        """
+        high = float(bar["High"])
+        low = float(bar["Low"])
+        close = float(bar["Close"])
+        volume = float(bar["Volume"])
+        prev_close = self._prev_close
+        self._prev_close = close
+
+        row = {}
+        row["SMA"] = self._sma.update(close)
+        row["EMA"] = self._ema.update(close)
+
+        bb_middle, bb_std = self._bollinger.update(close)
+        row["BB_Middle"] = bb_middle
+        row["BB_Upper"] = bb_middle + bb_std * self.bollinger_std
+        row["BB_Lower"] = bb_middle - bb_std * self.bollinger_std
+
+        delta = close - prev_close
+        gain = self._gain.update(delta if delta > 0 else 0.0)
+        loss = self._loss.update(-delta if delta < 0 else 0.0)
+        row["RSI"] = 100 - _divide(100, 1 + _divide(gain, loss))
+
+        macd = self._macd_fast.update(close) - self._macd_slow.update(close)
+        signal = self._macd_signal.update(macd)
+        row["MACD"] = macd
+        row["MACD_Signal"] = signal
+        row["MACD_Histogram"] = macd - signal
+
+        low_min = self._low_min.update(low)
+        high_max = self._high_max.update(high)
+        stoch_k = 100 * _divide(close - low_min, high_max - low_min)
+        row["Stoch_K"] = stoch_k
+        row["Stoch_D"] = self._stoch_d.update(stoch_k)
+
+        ranges = [r for r in (high - low, abs(high - prev_close), abs(low - prev_close))
+                  if not math.isnan(r)]
+        row["ATR"] = self._atr.update(max(ranges) if ranges else NAN)
+
+        volume_sma = self._volume_sma.update(volume)
+        row["Volume_SMA"] = volume_sma
+        row["Volume_Ratio"] = _divide(volume, volume_sma)
+
+        return row
@@ -1,47 +1,208 @@
 import pandas as pd
 import numpy as np
 
-def calculate_technical_indicators(data, sma_period=20, ema_period=12):
+import kernels
+from config import TECHNICAL_INDICATORS
+
+BASE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Output columns in the order they are added to the frame
+INDICATOR_COLUMNS = [
+    'SMA', 'EMA', 'BB_Middle', 'BB_Upper', 'BB_Lower', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'Stoch_K', 'Stoch_D',
+    'ATR', 'Volume_SMA', 'Volume_Ratio'
+]
+
+# Names callers can request instead of listing individual columns
+INDICATOR_GROUPS = {
+    'SMA': ['SMA'],
+    'EMA': ['EMA'],
+    'Bollinger': ['BB_Middle', 'BB_Upper', 'BB_Lower'],
+    'RSI': ['RSI'],
+    'MACD': ['MACD', 'MACD_Signal', 'MACD_Histogram'],
+    'Stochastic': ['Stoch_K', 'Stoch_D'],
+    'ATR': ['ATR'],
+    'Volume': ['Volume_SMA', 'Volume_Ratio']
+}
+
+def _rolling(series, kernel, window):
     """
-    Calculate various technical indicators for stock data
+    Apply a kernels.* sliding-window function to a Series or a (time x
+    symbols) DataFrame, keeping its labels
     """
-    df = data.copy()
+    values = kernel(series.to_numpy(dtype=float), window)
+    if isinstance(series, pd.DataFrame):
+        return pd.DataFrame(values, index=series.index, columns=series.columns)
+    return pd.Series(values, index=series.index)
+
+def _rsi_from_gain_loss(p):
+    rs = p.series('RSI_Gain') / p.series('RSI_Loss')
+    return 100 - (100 / (1 + rs))
+
+def _stochastic_k(p):
+    k_period = p.params['STOCHASTIC_K']
+    low_min = p.rolling_min('Low', k_period)
+    high_max = p.rolling_max('High', k_period)
+    return 100 * ((p.series('Close') - low_min) / (high_max - low_min))
+
+def _true_range(p):
+    high, low, close = p.series('High'), p.series('Low'), p.series('Close')
+    high_low = high - low
+    high_close = np.abs(high - close.shift())
+    low_close = np.abs(low - close.shift())
+    # fmax skips NaN like max(axis=1) and also works element-wise on panels
+    return np.fmax(np.fmax(high_low, high_close), low_close)
+
+# Each node is computed from other nodes through the pipeline, so shared
+# intermediates (the same rolling window or EMA) are only built once
+_NODES = {
+    'SMA': lambda p: p.rolling_mean('Close', p.sma_period),
+    'EMA': lambda p: p.ema('Close', p.ema_period),
+    'BB_Middle': lambda p: p.rolling_mean('Close', p.params['BOLLINGER_PERIOD']),
+    'BB_Upper': lambda p: p.series('BB_Middle') + p.rolling_std('Close', p.params['BOLLINGER_PERIOD']) * p.params['BOLLINGER_STD'],
+    'BB_Lower': lambda p: p.series('BB_Middle') - p.rolling_std('Close', p.params['BOLLINGER_PERIOD']) * p.params['BOLLINGER_STD'],
+    'Delta': lambda p: p.series('Close').diff(),
+    'Gain': lambda p: p.series('Delta').where(p.series('Delta') > 0, 0),
+    'Loss': lambda p: -p.series('Delta').where(p.series('Delta') < 0, 0),
+    'RSI_Gain': lambda p: p.rolling_mean('Gain', p.params['RSI_PERIOD']),
+    'RSI_Loss': lambda p: p.rolling_mean('Loss', p.params['RSI_PERIOD']),
+    'RSI': _rsi_from_gain_loss,
+    'MACD': lambda p: p.ema('Close', p.params['MACD_FAST']) - p.ema('Close', p.params['MACD_SLOW']),
+    'MACD_Signal': lambda p: p.ema('MACD', p.params['MACD_SIGNAL']),
+    'MACD_Histogram': lambda p: p.series('MACD') - p.series('MACD_Signal'),
+    'Stoch_K': _stochastic_k,
+    'Stoch_D': lambda p: p.rolling_mean('Stoch_K', p.params['STOCHASTIC_D']),
+    'True_Range': _true_range,
+    'ATR': lambda p: p.rolling_mean('True_Range', p.params['ATR_PERIOD']),
+    'Volume_SMA': lambda p: p.rolling_mean('Volume', p.params['VOLUME_SMA_PERIOD']),
+    'Volume_Ratio': lambda p: p.series('Volume') / p.series('Volume_SMA')
+}
+
+def resolve_indicator_columns(indicators=None):
+    """
+    Expand requested indicator names/groups into output columns (None = all)
+    """
+    if indicators is None:
+        return list(INDICATOR_COLUMNS)
+    
+    requested = set()
+    for name in indicators:
+        if name in INDICATOR_GROUPS:
+            requested.update(INDICATOR_GROUPS[name])
+        elif name in INDICATOR_COLUMNS:
+            requested.add(name)
+        else:
+            raise ValueError(f"Unknown indicator: {name}")
+    
+    return [column for column in INDICATOR_COLUMNS if column in requested]
+
+class IndicatorPipeline:
+    """
+    Lazy, memoized indicator graph over one OHLCV frame
+    
+    Only the requested outputs and their dependencies are computed, and
+    every intermediate (rolling window, EMA, derived series) is computed once.
+    """
+    
+    def __init__(self, data, sma_period=20, ema_period=12, params=None):
+        self.data = data
+        self.sma_period = sma_period
+        self.ema_period = ema_period
+        self.params = {**TECHNICAL_INDICATORS, **(params or {})}
+        self._memo = {}
+    
+    def _node(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
     
-    # Simple Moving Average (SMA)
-    df['SMA'] = df['Close'].rolling(window=sma_period).mean()
+    def series(self, name):
+        if name in BASE_COLUMNS:
+            return self.data[name]
+        return self._node(name, lambda: _NODES[name](self))
     
-    # Exponential Moving Average (EMA)
-    df['EMA'] = df['Close'].ewm(span=ema_period).mean()
+    def rolling_mean(self, name, period):
+        return self._node(('mean', name, period), lambda: self.series(name).rolling(window=period).mean())
     
-    # Bollinger Bands
-    df['BB_Middle'] = df['Close'].rolling(window=20).mean()
-    bb_std = df['Close'].rolling(window=20).std()
-    df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
-    df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+    def rolling_std(self, name, period):
+        return self._node(('std', name, period), lambda: self.series(name).rolling(window=period).std())
     
-    # RSI (Relative Strength Index)
-    df['RSI'] = calculate_rsi(df['Close'])
+    def rolling_min(self, name, period):
+        return self._node(('min', name, period), lambda: _rolling(self.series(name), kernels.rolling_min, period))
     
-    # MACD (Moving Average Convergence Divergence)
-    macd_data = calculate_macd(df['Close'])
-    df['MACD'] = macd_data['MACD']
-    df['MACD_Signal'] = macd_data['Signal']
-    df['MACD_Histogram'] = macd_data['Histogram']
+    def rolling_max(self, name, period):
+        return self._node(('max', name, period), lambda: _rolling(self.series(name), kernels.rolling_max, period))
     
-    # Stochastic Oscillator
-    stoch_data = calculate_stochastic(df)
-    df['Stoch_K'] = stoch_data['%K']
-    df['Stoch_D'] = stoch_data['%D']
+    def ema(self, name, span):
+        return self._node(('ema', name, span), lambda: self.series(name).ewm(span=span).mean())
     
-    # Average True Range (ATR)
-    df['ATR'] = calculate_atr(df)
+    def compute(self, indicators=None):
+        """
+        Compute the requested indicators and return {column: Series}
+        """
+        return {column: self.series(column) for column in resolve_indicator_columns(indicators)}
+
+def calculate_technical_indicators(data, sma_period=20, ema_period=12, indicators=None,
+                                   compact=False):
+    """
+    Calculate technical indicators for stock data
     
-    # Volume indicators
-    df['Volume_SMA'] = df['Volume'].rolling(window=20).mean()
-    df['Volume_Ratio'] = df['Volume'] / df['Volume_SMA']
+    indicators lists the columns or INDICATOR_GROUPS names to compute;
+    None computes all of them.
+    
+    By default the indicators are added to a copy of data. With compact=True
+    only the indicator columns are returned, as float32 on data's index,
+    without copying the OHLCV columns. Values are still computed in float64
+    and rounded once, so each differs from the float64 result by at most
+    2**-24 (about 6e-8) relative; NaN and inf are preserved.
+    """
+    if compact:
+        pipeline = IndicatorPipeline(data, sma_period, ema_period)
+        results = pipeline.compute(indicators)
+        return pd.DataFrame(
+            {column: values.to_numpy(dtype=np.float32) for column, values in results.items()},
+            index=data.index
+        )
+    
+    df = data.copy()
+    
+    pipeline = IndicatorPipeline(df, sma_period, ema_period)
+    for column, values in pipeline.compute(indicators).items():
+        df[column] = values
     
     return df
 
+def calculate_panel_indicators(close, high=None, low=None, volume=None,
+                               sma_period=20, ema_period=12, indicators=None,
+                               as_frame=True):
+    """
+    Calculate technical indicators for many symbols at once
+    
+    close/high/low/volume are (time x symbols) DataFrames or 2-D arrays with
+    the same shape; high/low are needed for Stochastic and ATR and volume for
+    the Volume group. Each indicator is computed column-wise over the whole
+    panel in one pass. Returns a DataFrame with (indicator, symbol) MultiIndex
+    columns, or {indicator: 2-D array} when as_frame is False.
+    """
+    panel = {}
+    for name, values in [('Close', close), ('High', high), ('Low', low), ('Volume', volume)]:
+        if values is None:
+            continue
+        if not isinstance(values, pd.DataFrame):
+            values = pd.DataFrame(np.asarray(values, dtype=float))
+        panel[name] = values
+    
+    pipeline = IndicatorPipeline(panel, sma_period, ema_period)
+    try:
+        results = pipeline.compute(indicators)
+    except KeyError as e:
+        raise ValueError(f"Panel input {e} is required for the requested indicators") from e
+    
+    if not as_frame:
+        return {column: values.to_numpy() for column, values in results.items()}
+    
+    return pd.concat(results, axis=1, names=['Indicator', 'Symbol'])
+
 def calculate_rsi(prices, period=14):
     """
     Calculate Relative Strength Index (RSI)
@@ -76,8 +237,8 @@ def calculate_stochastic(data, k_period=14, d_period=3):
     """
     Calculate Stochastic Oscillator
     """
-    low_min = data['Low'].rolling(window=k_period).min()
-    high_max = data['High'].rolling(window=k_period).max()
+    low_min = _rolling(data['Low'], kernels.rolling_min, k_period)
+    high_max = _rolling(data['High'], kernels.rolling_max, k_period)
     
     k_percent = 100 * ((data['Close'] - low_min) / (high_max - low_min))
     d_percent = k_percent.rolling(window=d_period).mean()
@@ -104,8 +265,8 @@ def calculate_williams_r(data, period=14):
     """
     Calculate Williams %R
     """
-    high_max = data['High'].rolling(window=period).max()
-    low_min = data['Low'].rolling(window=period).min()
+    high_max = _rolling(data['High'], kernels.rolling_max, period)
+    low_min = _rolling(data['Low'], kernels.rolling_min, period)
     
     williams_r = -100 * ((high_max - data['Close']) / (high_max - low_min))
     
@@ -117,9 +278,7 @@ def calculate_cci(data, period=20):
     """
     typical_price = (data['High'] + data['Low'] + data['Close']) / 3
     sma_tp = typical_price.rolling(window=period).mean()
-    mean_deviation = typical_price.rolling(window=period).apply(
-        lambda x: np.abs(x - x.mean()).mean()
-    )
+    mean_deviation = _rolling(typical_price, kernels.rolling_mean_abs_deviation, period)
     
     cci = (typical_price - sma_tp) / (0.015 * mean_deviation)
     
@@ -0,0 +1,73 @@
+"""
+Trace type selection in the chart builders
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import create_rsi_chart, create_stock_chart, scatter_trace_type  # noqa: E402
+from config import CHART_CONFIG  # noqa: E402
+
+
+def _frame(n_bars):
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(0, 1, n_bars).cumsum()
+    data = pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, n_bars),
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, n_bars),
+    }, index=pd.date_range('2020-01-01', periods=n_bars, freq='h'))
+    data['SMA'] = data['Close'].rolling(20).mean()
+    data['EMA'] = data['Close'].ewm(span=20).mean()
+    data['BB_Upper'] = data['SMA'] + 2
+    data['BB_Lower'] = data['SMA'] - 2
+    data['RSI'] = 50 + rng.normal(0, 10, n_bars)
+    return data
+
+
+def _line_types(fig):
+    return {trace.name: trace.type for trace in fig.data if trace.type in ('scatter', 'scattergl')}
+
+
+def test_scatter_trace_type_threshold():
+    threshold = CHART_CONFIG["WEBGL_THRESHOLD"]
+    assert scatter_trace_type(threshold) == 'scatter'
+    assert scatter_trace_type(threshold + 1) == 'scattergl'
+
+
+@pytest.mark.parametrize("n_bars, max_points, expected", [
+    (500, 2000, 'scatter'),      # small series stay SVG
+    (5000, 2000, 'scatter'),     # downsampled to 2000 points, at the threshold
+    (500, 0, 'scatter'),         # full resolution, still small
+    (5000, 0, 'scattergl'),      # full resolution, over the threshold
+])
+def test_stock_chart_line_trace_types(n_bars, max_points, expected):
+    fig = create_stock_chart(_frame(n_bars), 'TEST', 'Line', True, True, True, True,
+                             max_points=max_points)
+    types = _line_types(fig)
+    assert set(types) == {'Close Price', 'SMA', 'EMA', 'BB Upper', 'BB Lower'}
+    assert set(types.values()) == {expected}
+
+
+@pytest.mark.parametrize("n_bars, max_points, expected", [
+    (500, 2000, 'scatter'),
+    (5000, 2000, 'scatter'),
+    (5000, 0, 'scattergl'),
+])
+def test_rsi_chart_trace_type(n_bars, max_points, expected):
+    fig = create_rsi_chart(_frame(n_bars), max_points=max_points)
+    assert _line_types(fig) == {'RSI': expected}
+
+
+def test_candlestick_chart_is_not_a_scatter_trace():
+    fig = create_stock_chart(_frame(5000), 'TEST', 'Candlestick', False, False, False, False,
+                             max_points=0)
+    assert [trace.type for trace in fig.data] == ['candlestick']
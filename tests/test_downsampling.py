@@ -0,0 +1,49 @@
+"""
+NaN handling in OHLC bucket aggregation
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downsampling import aggregate_ohlc  # noqa: E402
+
+
+def _bars(n):
+    close = 100 + np.arange(n, dtype=np.float64)
+    return pd.DataFrame({
+        'Open': close - 0.5,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': np.full(n, 10.0),
+    }, index=pd.date_range('2024-01-02 09:30', periods=n, freq='min'))
+
+
+def test_nan_bar_does_not_blank_its_bucket():
+    data = _bars(100)
+    data.iloc[0] = np.nan      # first bar of bucket 0
+    data.iloc[19] = np.nan     # last bar of bucket 1
+    data.iloc[25, data.columns.get_loc('High')] = np.nan
+
+    bars = aggregate_ohlc(data, 10)
+
+    assert not bars.isna().any().any()
+    assert bars['Open'].iloc[0] == data['Open'].iloc[1]
+    assert bars['Close'].iloc[1] == data['Close'].iloc[18]
+    assert bars['High'].iloc[2] == data['High'].iloc[20:30].max()
+    assert bars['Volume'].iloc[0] == 90
+
+
+def test_all_nan_bucket_stays_nan():
+    data = _bars(100)
+    data.iloc[30:40] = np.nan
+
+    bars = aggregate_ohlc(data, 10)
+
+    assert bars.iloc[3][['Open', 'High', 'Low', 'Close']].isna().all()
+    assert bars.drop(bars.index[3]).notna().all().all()
@@ -0,0 +1,87 @@
+"""
+Thumbnail cache against a local stand-in image server
+"""
+
+import io
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from thumbnail_cache import ThumbnailCache  # noqa: E402
+
+
+def _jpeg(seed, size=(800, 600)):
+    pixels = np.random.default_rng(seed).integers(0, 256, size[::-1] + (3,), dtype=np.uint8)
+    output = io.BytesIO()
+    Image.fromarray(pixels).save(output, "JPEG")
+    return output.getvalue()
+
+
+IMAGES = {"/a.jpg": _jpeg(1), "/b.jpg": _jpeg(2)}
+
+
+class _ImageHandler(BaseHTTPRequestHandler):
+    requests_served = 0
+
+    def do_GET(self):
+        body = IMAGES.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        type(self).requests_served += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    _ImageHandler.requests_served = 0
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_loopback_rejected_unless_allowed(server, tmp_path):
+    cache = ThumbnailCache(str(tmp_path))
+    assert cache.get(f"{server}/a.jpg") is None
+    assert _ImageHandler.requests_served == 0
+
+
+def test_thumbnail_written_served_and_evicted(server, tmp_path):
+    cache = ThumbnailCache(str(tmp_path), allowed_hosts=("127.0.0.1",))
+    url_a, url_b = f"{server}/a.jpg", f"{server}/b.jpg"
+
+    thumbnail = cache.get(url_a)
+    assert thumbnail is not None
+    with Image.open(io.BytesIO(thumbnail)) as image:
+        assert image.width == 200
+    path_a = cache._path(url_a)
+    assert os.path.exists(path_a)
+
+    # Served from disk on the next call
+    assert cache.get(url_a) == thumbnail
+    assert _ImageHandler.requests_served == 1
+    assert cache.stats()["hits"] == 1
+
+    # Room for one thumbnail only: adding a second evicts the least recently used
+    cache.max_bytes = len(thumbnail) * 3 // 2
+    os.utime(path_a, (1, 1))
+    assert cache.get(url_b) is not None
+    assert not os.path.exists(path_a)
+    assert os.path.exists(cache._path(url_b))
+    assert cache.stats()["evictions"] == 1
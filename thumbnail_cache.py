@@ -0,0 +1,265 @@
+"""
+Local thumbnail cache for news images
+
+Remote article images are downloaded once, resized to THUMBNAIL_CACHE["WIDTH"]
+pixels wide and stored on disk as WebP (JPEG if Pillow lacks WebP support).
+The news ingestion worker warms the cache in the background and the News
+tab only reads thumbnails already on disk, so neither viewers' browsers nor
+the render path wait on third-party image hosts. The directory is bounded by
+size and evicts least recently used thumbnails.
+
+Image URLs come from feeds, so only http(s) URLs that resolve to public
+addresses are downloaded, redirects included, unless their host is listed in
+THUMBNAIL_CACHE["ALLOWED_HOSTS"] (e.g. a local stand-in server).
+"""
+
+import hashlib
+import io
+import ipaddress
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from PIL import Image, ImageOps, features
+
+from config import THUMBNAIL_CACHE
+
+_executor = ThreadPoolExecutor(
+    max_workers=THUMBNAIL_CACHE["MAX_WORKERS"], thread_name_prefix="thumbnails"
+)
+
+
+def check_public_url(url, allowed_hosts=()):
+    """
+    Raise ValueError unless url is http(s) and its host resolves only to
+    public addresses (not private, loopback, link-local or reserved)
+
+    Hosts in allowed_hosts (e.g. a local stand-in server) skip the address check.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"not an http(s) URL: {url}")
+    if parts.hostname in allowed_hosts:
+        return
+
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    for *_, address in socket.getaddrinfo(parts.hostname, port, proto=socket.IPPROTO_TCP):
+        ip = ipaddress.ip_address(address[0].split("%")[0])
+        if (ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_reserved
+                or ip.is_multicast or ip.is_unspecified):
+            raise ValueError(f"{parts.hostname} resolves to non-public address {ip}")
+
+
+def make_thumbnail(data, width=None, image_format=None):
+    """
+    Resize encoded image bytes to width pixels wide (never upscaling) and
+    re-encode them as WebP or JPEG
+    """
+    width = width or THUMBNAIL_CACHE["WIDTH"]
+    image_format = image_format or ("WEBP" if features.check("webp") else "JPEG")
+
+    with Image.open(io.BytesIO(data)) as image:
+        image.draft("RGB", (width, width))  # JPEG decoders can downscale while decoding
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+        if image_format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+
+        output = io.BytesIO()
+        image.save(output, image_format, quality=THUMBNAIL_CACHE["QUALITY"])
+        return output.getvalue()
+
+
+class ThumbnailCache:
+    """
+    Size-bounded on-disk LRU cache of resized images keyed by source URL
+    """
+
+    def __init__(self, directory=None, max_bytes=None, width=None, allowed_hosts=None):
+        self.directory = directory or THUMBNAIL_CACHE["DIRECTORY"]
+        self.max_bytes = max_bytes or THUMBNAIL_CACHE["MAX_BYTES"]
+        self.width = width or THUMBNAIL_CACHE["WIDTH"]
+        self.allowed_hosts = frozenset(
+            THUMBNAIL_CACHE["ALLOWED_HOSTS"] if allowed_hosts is None else allowed_hosts
+        )
+        self.image_format = "WEBP" if features.check("webp") else "JPEG"
+        self._lock = threading.Lock()
+        self._sizes = None
+        self._failures = {}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.evictions = 0
+
+    def _path(self, url):
+        name = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{name}.{self.image_format.lower()}")
+
+    def _load_sizes(self):
+        # Sizes of the files on disk, scanned once per process
+        if self._sizes is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._sizes = {}
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    self._sizes[entry.path] = entry.stat().st_size
+        return self._sizes
+
+    def _evict(self, sizes):
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        by_last_use = sorted(sizes, key=lambda path: os.stat(path).st_mtime if os.path.exists(path) else 0)
+        for path in by_last_use:
+            if total <= self.max_bytes:
+                break
+            total -= sizes.pop(path)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.evictions += 1
+
+    def _download(self, url):
+        # Follow redirects by hand so every hop is checked before it is requested
+        for _ in range(THUMBNAIL_CACHE["MAX_REDIRECTS"] + 1):
+            check_public_url(url, self.allowed_hosts)
+            response = requests.get(
+                url, timeout=THUMBNAIL_CACHE["TIMEOUT"], stream=True, allow_redirects=False
+            )
+            if not response.is_redirect:
+                break
+            url = urljoin(url, response.headers["Location"])
+            response.close()
+        else:
+            raise ValueError(f"more than {THUMBNAIL_CACHE['MAX_REDIRECTS']} redirects")
+        response.raise_for_status()
+        data = response.raw.read(THUMBNAIL_CACHE["MAX_DOWNLOAD_BYTES"] + 1, decode_content=True)
+        if len(data) > THUMBNAIL_CACHE["MAX_DOWNLOAD_BYTES"]:
+            raise ValueError(f"image larger than {THUMBNAIL_CACHE['MAX_DOWNLOAD_BYTES']} bytes")
+        return data
+
+    def cached(self, url):
+        """
+        Return thumbnail bytes for an image URL if they are on disk, else None
+        """
+        if not url:
+            return None
+        path = self._path(url)
+
+        with self._lock:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path)  # mark as recently used
+                self.hits += 1
+                return data
+            except OSError:
+                self.misses += 1
+                return None
+
+    def get(self, url):
+        """
+        Return thumbnail bytes for an image URL, downloading them on a miss,
+        or None if it cannot be fetched
+
+        Failed URLs are not retried for THUMBNAIL_CACHE["RETRY_AFTER"] seconds.
+        """
+        if not url:
+            return None
+        with self._lock:
+            failed_at = self._failures.get(url)
+            if failed_at is not None and time.time() - failed_at < THUMBNAIL_CACHE["RETRY_AFTER"]:
+                return None
+
+        data = self.cached(url)
+        if data is not None:
+            return data
+        path = self._path(url)
+
+        try:
+            thumbnail = make_thumbnail(self._download(url), self.width, self.image_format)
+        except Exception as e:
+            print(f"Error fetching thumbnail {url}: {e}")
+            with self._lock:
+                self.errors += 1
+                if len(self._failures) >= THUMBNAIL_CACHE["MAX_FAILURES"]:
+                    self._failures.clear()
+                self._failures[url] = time.time()
+            return None
+
+        with self._lock:
+            sizes = self._load_sizes()
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, path)
+            sizes[path] = len(thumbnail)
+            self._failures.pop(url, None)
+            self._evict(sizes)
+        return thumbnail
+
+    def stats(self):
+        """
+        Return hit/miss counters and the bytes on disk
+        """
+        with self._lock:
+            sizes = self._load_sizes()
+            return {
+                "files": len(sizes),
+                "bytes": sum(sizes.values()),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "evictions": self.evictions
+            }
+
+
+_thumbnail_cache = ThumbnailCache()
+
+
+def get_thumbnail(url):
+    """
+    Get the cached thumbnail bytes for an image URL, or None
+    """
+    return _thumbnail_cache.get(url)
+
+
+def get_thumbnails(urls):
+    """
+    Get thumbnails for several image URLs concurrently, as a dict of url -> bytes or None
+    """
+    urls = list(dict.fromkeys(url for url in urls if url))
+    return dict(zip(urls, _executor.map(_thumbnail_cache.get, urls)))
+
+
+def get_cached_thumbnails(urls):
+    """
+    Get the thumbnails already on disk for several image URLs, without
+    downloading, as a dict of url -> bytes or None
+    """
+    return {url: _thumbnail_cache.cached(url) for url in dict.fromkeys(url for url in urls if url)}
+
+
+def warm_thumbnails(urls):
+    """
+    Download missing thumbnails for several image URLs in the background
+    """
+    for url in dict.fromkeys(url for url in urls if url):
+        _executor.submit(_thumbnail_cache.get, url)
+
+
+def get_thumbnail_cache_stats():
+    """
+    Get hit/miss counters for the thumbnail cache
+    """
+    return _thumbnail_cache.stats()
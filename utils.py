@@ -8,6 +8,10 @@ from datetime import datetime, timedelta
 import streamlit as st
 import yfinance as yf
 
+from info_cache import get_company_info
+from news_ingest import register_symbols, unregister_symbols
+from quotes import get_quotes
+
 def format_number(num, prefix="", suffix=""):
     """
     Format numbers with appropriate suffixes (K, M, B, T)
@@ -47,8 +51,7 @@ def validate_stock_symbol(symbol):
     Validate if a stock symbol exists and has data
     """
     try:
-        stock = yf.Ticker(symbol)
-        info = stock.info
+        info = get_company_info(symbol)
         return bool(info.get('symbol') or info.get('shortName'))
     except:
         return False
@@ -205,23 +208,15 @@ def get_sector_performance():
     }
     
     sector_data = {}
+    quotes = get_quotes(list(sector_etfs.values()), period="5d")
     
     for sector, etf in sector_etfs.items():
-        try:
-            ticker = yf.Ticker(etf)
-            hist = ticker.history(period="5d")
-            if not hist.empty:
-                current = hist['Close'].iloc[-1]
-                previous = hist['Close'].iloc[-2] if len(hist) > 1 else current
-                change_pct = ((current - previous) / previous) * 100
-                
-                sector_data[sector] = {
-                    "price": current,
-                    "change_pct": change_pct,
-                    "symbol": etf
-                }
-        except:
-            continue
+        if etf in quotes:
+            sector_data[sector] = {
+                "price": quotes[etf]["price"],
+                "change_pct": quotes[etf]["change_pct"],
+                "symbol": etf
+            }
     
     return sector_data
 
@@ -242,6 +237,7 @@ def add_to_watchlist(symbol):
     if symbol not in watchlist:
         watchlist.append(symbol.upper())
         st.session_state.watchlist = watchlist
+        register_symbols([symbol])
         return True
     return False
 
@@ -253,9 +249,20 @@ def remove_from_watchlist(symbol):
     if symbol in watchlist:
         watchlist.remove(symbol)
         st.session_state.watchlist = watchlist
+        unregister_symbols([symbol])
         return True
     return False
 
+def get_watchlist_quotes():
+    """
+    Get latest quotes for every symbol in the watchlist
+    """
+    watchlist = create_watchlist()
+    if not watchlist:
+        return {}
+    
+    return get_quotes(watchlist, period="5d")
+
 def get_economic_indicators():
     """
     Get basic economic indicators
@@ -270,24 +277,15 @@ def get_economic_indicators():
     }
     
     indicator_data = {}
+    quotes = get_quotes(list(indicators.values()), period="2d")
     
     for name, symbol in indicators.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
-            if not hist.empty:
-                current = hist['Close'].iloc[-1]
-                previous = hist['Close'].iloc[-2] if len(hist) > 1 else current
-                change = current - previous
-                change_pct = (change / previous) * 100 if previous != 0 else 0
-                
-                indicator_data[name] = {
-                    "value": current,
-                    "change": change,
-                    "change_pct": change_pct,
-                    "symbol": symbol
-                }
-        except:
-            continue
+        if symbol in quotes:
+            indicator_data[name] = {
+                "value": quotes[symbol]["price"],
+                "change": quotes[symbol]["change"],
+                "change_pct": quotes[symbol]["change_pct"],
+                "symbol": symbol
+            }
     
     return indicator_data
\ No newline at end of file